@@ -0,0 +1,184 @@
+"""
+Almacén de obstáculos en arreglos NumPy (estructura de arreglos)
+Guarda x, carril, código de tipo y daño de cada obstáculo en arreglos paralelos ordenados
+por (x, carril), sincronizados con el Árbol AVL, para que la selección de visibles y la
+detección de colisiones sean una búsqueda binaria y una expresión vectorizada sobre un tramo.
+NumPy es opcional: si no está instalado, NUMPY_DISPONIBLE es False y el juego usa el árbol.
+"""
+
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    np = None
+    NUMPY_DISPONIBLE = False
+
+from obstaculo import OBSTACULO_CONFIG
+from registro_obstaculo import TIPOS_OBSTACULO
+
+_COLUMNAS = ('x', 'carril', 'codigo', 'dano', 'registros')
+
+class AlmacenObstaculosNumpy:
+    """
+    Arreglos paralelos x / carril / código / daño con los mismos registros que el árbol.
+    Los registros vivos ocupan el tramo [inicio, fin) ordenado como el recorrido en orden
+    del árbol: descartar los que quedaron atrás solo adelanta inicio.
+    """
+    def __init__(self, capacidad=1024):
+        if not NUMPY_DISPONIBLE:
+            raise ImportError("AlmacenObstaculosNumpy requiere numpy instalado")
+
+        capacidad = max(1, capacidad)
+        self.x = np.empty(capacidad, dtype=np.float64)
+        self.carril = np.empty(capacidad, dtype=np.int16)
+        self.codigo = np.empty(capacidad, dtype=np.int16)
+        self.dano = np.empty(capacidad, dtype=np.int16)
+        self.registros = np.empty(capacidad, dtype=object)
+        self.inicio = 0
+        self.fin = 0
+
+    @property
+    def cantidad(self):
+        """Número de registros en el almacén"""
+        return self.fin - self.inicio
+
+    @classmethod
+    def desde_lista(cls, registros):
+        """Construye el almacén con todos los registros de una vez (ya ordenados por (x, y))"""
+        almacen = cls(len(registros))
+        cantidad = len(registros)
+        if cantidad:
+            almacen.x[:cantidad] = [obs.x for obs in registros]
+            almacen.carril[:cantidad] = [obs.y for obs in registros]
+            almacen.codigo[:cantidad] = [obs.codigo for obs in registros]
+            almacen.dano[:cantidad] = [almacen._dano_de(obs.codigo) for obs in registros]
+            almacen.registros[:cantidad] = registros
+        almacen.fin = cantidad
+        return almacen
+
+    def _dano_de(self, codigo):
+        """Energía que quita un tipo de obstáculo (0 si el tipo no está configurado)"""
+        config = OBSTACULO_CONFIG.get(TIPOS_OBSTACULO[codigo])
+        return config['energia_perdida'] if config else 0
+
+    def _buscar(self, x, y):
+        """
+        Posición de (x, y) en los arreglos y si ya está ocupada: (i, True) si existe,
+        (i, False) con la posición donde habría que insertarlo para mantener el orden
+        """
+        izquierda = self.inicio + int(np.searchsorted(self.x[self.inicio:self.fin], x, 'left'))
+        i = izquierda
+        # Entre los de igual x se ordena por carril (son pocos: uno por carril como máximo)
+        while i < self.fin and self.x[i] == x and self.carril[i] < y:
+            i += 1
+        return i, i < self.fin and self.x[i] == x and self.carril[i] == y
+
+    def _hacer_lugar(self):
+        """Deja al menos un lugar libre al final del tramo: compacta o duplica la capacidad"""
+        cantidad = self.cantidad
+        if cantidad * 2 > len(self.x):
+            capacidad = len(self.x) * 2
+            for nombre in _COLUMNAS:
+                viejo = getattr(self, nombre)
+                nuevo = np.empty(capacidad, dtype=viejo.dtype)
+                nuevo[:cantidad] = viejo[self.inicio:self.fin]
+                setattr(self, nombre, nuevo)
+        else:
+            # Más de la mitad del espacio quedó libre al principio: mover el tramo ahí
+            for nombre in _COLUMNAS:
+                arreglo = getattr(self, nombre)
+                arreglo[:cantidad] = arreglo[self.inicio:self.fin]
+            self.registros[cantidad:self.fin] = None
+        self.inicio = 0
+        self.fin = cantidad
+
+    def insertar(self, registro):
+        """
+        Inserta un registro en su lugar según (x, carril). Desplaza el lado más corto del
+        tramo: los obstáculos nuevos suelen quedar cerca del carrito, es decir, del inicio.
+        """
+        i, existe = self._buscar(registro.x, registro.y)
+        if existe:
+            return
+
+        if self.inicio > 0 and i - self.inicio < self.fin - i:
+            # Correr un lugar hacia atrás los anteriores
+            inicio = self.inicio
+            for nombre in _COLUMNAS:
+                arreglo = getattr(self, nombre)
+                arreglo[inicio - 1:i - 1] = arreglo[inicio:i]
+            self.inicio = inicio - 1
+            i -= 1
+        else:
+            if self.fin == len(self.x):
+                desplazamiento = self.inicio
+                self._hacer_lugar()
+                i -= desplazamiento
+            # Correr un lugar hacia adelante los posteriores
+            fin = self.fin
+            for nombre in _COLUMNAS:
+                arreglo = getattr(self, nombre)
+                arreglo[i + 1:fin + 1] = arreglo[i:fin]
+            self.fin = fin + 1
+
+        self.x[i] = registro.x
+        self.carril[i] = registro.y
+        self.codigo[i] = registro.codigo
+        self.dano[i] = self._dano_de(registro.codigo)
+        self.registros[i] = registro
+
+    def eliminar(self, registro):
+        """Quita un registro cerrando el hueco con el lado más corto del tramo"""
+        i, existe = self._buscar(registro.x, registro.y)
+        if not existe:
+            return
+
+        inicio, fin = self.inicio, self.fin
+        if i - inicio < fin - i:
+            for nombre in _COLUMNAS:
+                arreglo = getattr(self, nombre)
+                arreglo[inicio + 1:i + 1] = arreglo[inicio:i]
+            self.registros[inicio] = None
+            self.inicio = inicio + 1
+        else:
+            for nombre in _COLUMNAS:
+                arreglo = getattr(self, nombre)
+                arreglo[i:fin - 1] = arreglo[i + 1:fin]
+            self.registros[fin - 1] = None
+            self.fin = fin - 1
+
+    def eliminar_menores_que(self, x_limite):
+        """Quita todos los registros con x < x_limite adelantando el inicio (O(log n + k))"""
+        corte = self.inicio + int(np.searchsorted(self.x[self.inicio:self.fin], x_limite, 'left'))
+        if corte == self.inicio:
+            return
+        self.registros[self.inicio:corte] = None
+        self.inicio = corte
+
+    def visibles(self, x_min, x_max):
+        """Registros con x_min <= x <= x_max (dos búsquedas binarias y una copia del tramo)"""
+        x = self.x[self.inicio:self.fin]
+        desde = self.inicio + int(np.searchsorted(x, x_min, 'left'))
+        hasta = self.inicio + int(np.searchsorted(x, x_max, 'right'))
+        return self.registros[desde:hasta].copy()
+
+    def primera_colision(self, carrito, area_colision):
+        """
+        (registro, daño) del obstáculo que choca con el carrito en este frame, o (None, 0).
+        Misma condición que Obstaculo.colisiona_con_carrito, evaluada sobre el tramo de x
+        que puede tocar al carrito.
+        """
+        if carrito.saltando and carrito.altura_salto > 20:
+            return None, 0  # El carrito puede saltar sobre obstáculos
+
+        # |carrito.x - (x - distancia)| < area_colision
+        centro = carrito.x + carrito.distancia_recorrida
+        x = self.x[self.inicio:self.fin]
+        desde = self.inicio + int(np.searchsorted(x, centro - area_colision, 'right'))
+        hasta = self.inicio + int(np.searchsorted(x, centro + area_colision, 'left'))
+        choques = np.flatnonzero(self.carril[desde:hasta] == carrito.y)
+        if not len(choques):
+            return None, 0
+        # Igual que el índice por carril: el más cercano por delante (el tramo está ordenado)
+        i = desde + choques[0]
+        return self.registros[i], int(self.dano[i])
@@ -2,19 +2,83 @@
 Implementación del Árbol AVL para gestionar obstáculos dinámicamente
 """
 
+import json
+
 class NodoAVL:
+    __slots__ = ('obstaculo', 'altura', 'tamano', 'izquierdo', 'derecho')
+    
     def __init__(self, obstaculo):
         self.obstaculo = obstaculo
         self.altura = 1
+        self.tamano = 1  # Número de nodos del subárbol (incluye este)
         self.izquierdo = None
         self.derecho = None
     
     def __str__(self):
-        return f"Obstáculo(x={self.obstaculo['x']}, y={self.obstaculo['y']}, tipo={self.obstaculo['tipo']})"
+        return f"Obstáculo(x={self.obstaculo.x}, y={self.obstaculo.y}, tipo={self.obstaculo.tipo})"
 
 class ArbolAVL:
     def __init__(self):
         self.raiz = None
+        self.version = 0  # Se incrementa con cada modificación del árbol
+        
+        # Estadísticas que se mantienen en cada modificación (se leen en O(1))
+        self.por_tipo = {}  # tipo -> cantidad de obstáculos en el árbol
+        self.rotaciones = {'izquierda': 0, 'derecha': 0}
+        self.total_inserciones = 0
+        self.total_eliminaciones = 0
+    
+    @classmethod
+    def desde_lista(cls, obstaculos):
+        """
+        Construye un árbol perfectamente balanceado a partir de una lista de obstáculos.
+        Ordena por (x, y) solo si la lista no viene ordenada y descarta coordenadas repetidas
+        (se conserva la primera aparición, igual que con insertar). Con la lista ya ordenada
+        la construcción es O(n) y no realiza rotaciones.
+        """
+        ordenados = list(obstaculos)
+        claves = [(obs.x, obs.y) for obs in ordenados]
+        if any(claves[i] > claves[i + 1] for i in range(len(claves) - 1)):
+            # sort es estable: entre repetidos queda primero el que apareció antes
+            orden = sorted(range(len(ordenados)), key=claves.__getitem__)
+            ordenados = [ordenados[i] for i in orden]
+            claves = [claves[i] for i in orden]
+        
+        # Eliminar coordenadas repetidas
+        unicos = []
+        ultima_clave = None
+        for obs, clave in zip(ordenados, claves):
+            if clave != ultima_clave:
+                unicos.append(obs)
+                ultima_clave = clave
+        
+        arbol = cls()
+        arbol.raiz = arbol._construir_balanceado(unicos, 0, len(unicos))
+        for obs in unicos:
+            arbol._contar_tipo(obs, 1)
+        arbol.total_inserciones = len(unicos)
+        return arbol
+    
+    def _construir_balanceado(self, obstaculos, inicio, fin):
+        """Construye recursivamente el subárbol balanceado de obstaculos[inicio:fin]"""
+        if inicio >= fin:
+            return None
+        
+        medio = (inicio + fin) // 2
+        nodo = NodoAVL(obstaculos[medio])
+        nodo.izquierdo = self._construir_balanceado(obstaculos, inicio, medio)
+        nodo.derecho = self._construir_balanceado(obstaculos, medio + 1, fin)
+        self.actualizar_altura(nodo)
+        return nodo
+    
+    def _contar_tipo(self, obstaculo, cambio):
+        """Suma cambio (+1 / -1) a la cantidad de obstáculos del tipo del obstáculo"""
+        tipo = obstaculo.tipo
+        cantidad = self.por_tipo.get(tipo, 0) + cambio
+        if cantidad:
+            self.por_tipo[tipo] = cantidad
+        else:
+            del self.por_tipo[tipo]
     
     def altura(self, nodo):
         """Obtiene la altura de un nodo"""
@@ -28,13 +92,21 @@ class ArbolAVL:
             return 0
         return self.altura(nodo.izquierdo) - self.altura(nodo.derecho)
     
+    def tamano(self, nodo):
+        """Obtiene el número de nodos del subárbol de un nodo"""
+        if not nodo:
+            return 0
+        return nodo.tamano
+    
     def actualizar_altura(self, nodo):
-        """Actualiza la altura de un nodo"""
+        """Actualiza la altura y el tamaño del subárbol de un nodo"""
         if nodo:
             nodo.altura = 1 + max(self.altura(nodo.izquierdo), self.altura(nodo.derecho))
+            nodo.tamano = 1 + self.tamano(nodo.izquierdo) + self.tamano(nodo.derecho)
     
     def rotar_derecha(self, y):
         """Rotación simple a la derecha"""
+        self.rotaciones['derecha'] += 1
         x = y.izquierdo
         T2 = x.derecho
         
@@ -50,6 +122,7 @@ class ArbolAVL:
     
     def rotar_izquierda(self, x):
         """Rotación simple a la izquierda"""
+        self.rotaciones['izquierda'] += 1
         y = x.derecho
         T2 = y.izquierdo
         
@@ -63,119 +136,164 @@ class ArbolAVL:
         
         return y
     
-    def insertar(self, obstaculo):
-        """Inserta un obstáculo en el árbol AVL"""
-        self.raiz = self._insertar_recursivo(self.raiz, obstaculo)
-    
-    def _insertar_recursivo(self, nodo, obstaculo):
-        """Función recursiva para insertar en el árbol"""
-        # Paso 1: Inserción normal de BST
-        if not nodo:
-            return NodoAVL(obstaculo)
-        
-        # Comparar primero por x, luego por y en caso de empate
-        if obstaculo['x'] < nodo.obstaculo['x']:
-            nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, obstaculo)
-        elif obstaculo['x'] > nodo.obstaculo['x']:
-            nodo.derecho = self._insertar_recursivo(nodo.derecho, obstaculo)
-        else:  # x es igual, comparar por y
-            if obstaculo['y'] < nodo.obstaculo['y']:
-                nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, obstaculo)
-            elif obstaculo['y'] > nodo.obstaculo['y']:
-                nodo.derecho = self._insertar_recursivo(nodo.derecho, obstaculo)
-            else:
-                # No se permiten coordenadas repetidas
-                return nodo
+    def _balancear(self, nodo):
+        """Actualiza altura y tamaño de un nodo y lo rebalancea si hace falta (devuelve la nueva raíz del subárbol)"""
+        izq = nodo.izquierdo
+        der = nodo.derecho
+        h_izq = izq.altura if izq else 0
+        h_der = der.altura if der else 0
+        balance = h_izq - h_der
         
-        # Paso 2: Actualizar altura del nodo actual
-        self.actualizar_altura(nodo)
-        
-        # Paso 3: Obtener factor de balance
-        balance = self.factor_balance(nodo)
-        
-        # Paso 4: Si el nodo está desbalanceado, hay 4 casos
-        
-        # Caso Izquierda-Izquierda
-        if balance > 1 and ((obstaculo['x'] < nodo.izquierdo.obstaculo['x']) or 
-                           (obstaculo['x'] == nodo.izquierdo.obstaculo['x'] and 
-                            obstaculo['y'] < nodo.izquierdo.obstaculo['y'])):
+        if balance > 1:
+            # Izquierda-Derecha: primero rotar el hijo izquierdo
+            if self.factor_balance(izq) < 0:
+                nodo.izquierdo = self.rotar_izquierda(izq)
             return self.rotar_derecha(nodo)
         
-        # Caso Derecha-Derecha
-        if balance < -1 and ((obstaculo['x'] > nodo.derecho.obstaculo['x']) or 
-                            (obstaculo['x'] == nodo.derecho.obstaculo['x'] and 
-                             obstaculo['y'] > nodo.derecho.obstaculo['y'])):
+        if balance < -1:
+            # Derecha-Izquierda: primero rotar el hijo derecho
+            if self.factor_balance(der) > 0:
+                nodo.derecho = self.rotar_derecha(der)
             return self.rotar_izquierda(nodo)
         
-        # Caso Izquierda-Derecha
-        if balance > 1 and ((obstaculo['x'] > nodo.izquierdo.obstaculo['x']) or 
-                           (obstaculo['x'] == nodo.izquierdo.obstaculo['x'] and 
-                            obstaculo['y'] > nodo.izquierdo.obstaculo['y'])):
-            nodo.izquierdo = self.rotar_izquierda(nodo.izquierdo)
-            return self.rotar_derecha(nodo)
+        nodo.altura = 1 + (h_izq if h_izq > h_der else h_der)
+        nodo.tamano = 1 + (izq.tamano if izq else 0) + (der.tamano if der else 0)
+        return nodo
+    
+    def _rebalancear_camino(self, camino, subarbol):
+        """
+        Sube por el camino recorrido (lista de (nodo, fue_a_la_izquierda)) reenganchando
+        el subárbol modificado y rebalanceando cada ancestro hasta la raíz
+        """
+        while camino:
+            padre, fue_izquierda = camino.pop()
+            if fue_izquierda:
+                padre.izquierdo = subarbol
+            else:
+                padre.derecho = subarbol
+            subarbol = self._balancear(padre)
+        self.raiz = subarbol
+    
+    def insertar(self, obstaculo):
+        """Inserta un obstáculo en el árbol AVL (versión iterativa con pila de camino)"""
+        x = obstaculo.x
+        y = obstaculo.y
+        camino = []
+        nodo = self.raiz
         
-        # Caso Derecha-Izquierda
-        if balance < -1 and ((obstaculo['x'] < nodo.derecho.obstaculo['x']) or 
-                            (obstaculo['x'] == nodo.derecho.obstaculo['x'] and 
-                             obstaculo['y'] < nodo.derecho.obstaculo['y'])):
-            nodo.derecho = self.rotar_derecha(nodo.derecho)
-            return self.rotar_izquierda(nodo)
+        # Bajar por el árbol comparando (x, y) una sola vez por nivel
+        while nodo:
+            actual = nodo.obstaculo
+            nodo_x = actual.x
+            if x < nodo_x or (x == nodo_x and y < actual.y):
+                camino.append((nodo, True))
+                nodo = nodo.izquierdo
+            elif x > nodo_x or y > actual.y:
+                camino.append((nodo, False))
+                nodo = nodo.derecho
+            else:
+                # No se permiten coordenadas repetidas
+                return
         
-        # Retornar nodo sin cambios
-        return nodo
+        self._rebalancear_camino(camino, NodoAVL(obstaculo))
+        self.version += 1
+        self.total_inserciones += 1
+        self._contar_tipo(obstaculo, 1)
     
     def eliminar(self, x, y):
-        """Elimina un obstáculo del árbol por coordenadas"""
-        self.raiz = self._eliminar_recursivo(self.raiz, x, y)
-    
-    def _eliminar_recursivo(self, nodo, x, y):
-        """Función recursiva para eliminar del árbol"""
-        if not nodo:
-            return nodo
+        """Elimina un obstáculo del árbol por coordenadas (versión iterativa con pila de camino)"""
+        camino = []
+        nodo = self.raiz
         
         # Buscar el nodo a eliminar
-        if x < nodo.obstaculo['x']:
-            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, x, y)
-        elif x > nodo.obstaculo['x']:
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, x, y)
-        else:  # x es igual
-            if y < nodo.obstaculo['y']:
-                nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, x, y)
-            elif y > nodo.obstaculo['y']:
-                nodo.derecho = self._eliminar_recursivo(nodo.derecho, x, y)
+        while nodo:
+            actual = nodo.obstaculo
+            nodo_x = actual.x
+            if x < nodo_x or (x == nodo_x and y < actual.y):
+                camino.append((nodo, True))
+                nodo = nodo.izquierdo
+            elif x > nodo_x or y > actual.y:
+                camino.append((nodo, False))
+                nodo = nodo.derecho
             else:
-                # Este es el nodo a eliminar
-                if not nodo.izquierdo:
-                    return nodo.derecho
-                elif not nodo.derecho:
-                    return nodo.izquierdo
-                
-                # Nodo con dos hijos - obtener sucesor
-                temp = self._obtener_minimo(nodo.derecho)
-                nodo.obstaculo = temp.obstaculo
-                nodo.derecho = self._eliminar_recursivo(nodo.derecho, 
-                                                       temp.obstaculo['x'], 
-                                                       temp.obstaculo['y'])
-        
-        # Actualizar altura y rebalancear
-        self.actualizar_altura(nodo)
-        balance = self.factor_balance(nodo)
+                break
         
-        # Rebalancear si es necesario
-        if balance > 1 and self.factor_balance(nodo.izquierdo) >= 0:
-            return self.rotar_derecha(nodo)
+        if not nodo:
+            return
         
-        if balance > 1 and self.factor_balance(nodo.izquierdo) < 0:
-            nodo.izquierdo = self.rotar_izquierda(nodo.izquierdo)
-            return self.rotar_derecha(nodo)
+        eliminado = nodo.obstaculo
+        if nodo.izquierdo and nodo.derecho:
+            # Nodo con dos hijos - copiar el sucesor y eliminarlo de su posición
+            camino.append((nodo, False))
+            sucesor = nodo.derecho
+            while sucesor.izquierdo:
+                camino.append((sucesor, True))
+                sucesor = sucesor.izquierdo
+            nodo.obstaculo = sucesor.obstaculo
+            reemplazo = sucesor.derecho
+        else:
+            reemplazo = nodo.izquierdo or nodo.derecho
         
-        if balance < -1 and self.factor_balance(nodo.derecho) <= 0:
-            return self.rotar_izquierda(nodo)
+        self._rebalancear_camino(camino, reemplazo)
+        self.version += 1
+        self.total_eliminaciones += 1
+        self._contar_tipo(eliminado, -1)
+    
+    def eliminar_menores_que(self, x_limite):
+        """
+        Elimina todos los obstáculos con x < x_limite dividiendo el árbol en O(log n + k).
+        Devuelve la lista (ordenada) de obstáculos eliminados; si no hay ninguno el costo
+        es solo recorrer el borde izquierdo del árbol.
+        """
+        if not self.raiz or self._obtener_minimo(self.raiz).obstaculo.x >= x_limite:
+            return []
         
-        if balance < -1 and self.factor_balance(nodo.derecho) > 0:
-            nodo.derecho = self.rotar_derecha(nodo.derecho)
-            return self.rotar_izquierda(nodo)
+        menores, self.raiz = self._dividir(self.raiz, x_limite)
+        self.version += 1
+        # Recolectar los eliminados en orden sin recursión: pila con el borde izquierdo
+        pila = []
+        while menores:
+            pila.append(menores)
+            menores = menores.izquierdo
+        eliminados = list(self._continuar_inorden(pila))
+        self.total_eliminaciones += len(eliminados)
+        for obs in eliminados:
+            self._contar_tipo(obs, -1)
+        return eliminados
+    
+    def _dividir(self, nodo, x_limite):
+        """Divide un subárbol en (obstáculos con x < x_limite, resto), ambos balanceados"""
+        if not nodo:
+            return None, None
+        
+        izquierdo = nodo.izquierdo
+        derecho = nodo.derecho
+        if nodo.obstaculo.x < x_limite:
+            menores, resto = self._dividir(derecho, x_limite)
+            return self._unir(izquierdo, nodo, menores), resto
+        
+        menores, resto = self._dividir(izquierdo, x_limite)
+        return menores, self._unir(resto, nodo, derecho)
+    
+    def _unir(self, izquierdo, nodo, derecho):
+        """
+        Une dos subárboles AVL usando nodo como raíz intermedia (todas las claves de
+        izquierdo < nodo < derecho). Baja por el borde del más alto y rebalancea al subir.
+        """
+        h_izq = self.altura(izquierdo)
+        h_der = self.altura(derecho)
+        
+        if h_izq > h_der + 1:
+            izquierdo.derecho = self._unir(izquierdo.derecho, nodo, derecho)
+            return self._balancear(izquierdo)
         
+        if h_der > h_izq + 1:
+            derecho.izquierdo = self._unir(izquierdo, nodo, derecho.izquierdo)
+            return self._balancear(derecho)
+        
+        nodo.izquierdo = izquierdo
+        nodo.derecho = derecho
+        self.actualizar_altura(nodo)
         return nodo
     
     def _obtener_minimo(self, nodo):
@@ -196,15 +314,15 @@ class ArbolAVL:
             return
         
         # Si el obstáculo está en el rango, agregarlo
-        if (x_min <= nodo.obstaculo['x'] <= x_max and 
-            y_min <= nodo.obstaculo['y'] <= y_max):
+        if (x_min <= nodo.obstaculo.x <= x_max and 
+            y_min <= nodo.obstaculo.y <= y_max):
             obstaculos.append(nodo.obstaculo)
         
         # Buscar en subárboles si es necesario
-        if x_min <= nodo.obstaculo['x']:
+        if x_min <= nodo.obstaculo.x:
             self._buscar_en_rango_recursivo(nodo.izquierdo, x_min, x_max, y_min, y_max, obstaculos)
         
-        if x_max >= nodo.obstaculo['x']:
+        if x_max >= nodo.obstaculo.x:
             self._buscar_en_rango_recursivo(nodo.derecho, x_min, x_max, y_min, y_max, obstaculos)
     
     def obtener_obstaculos_visibles(self, carrito_x, pantalla_ancho):
@@ -216,73 +334,233 @@ class ArbolAVL:
         
         return self.buscar_en_rango(x_min, x_max, y_min, y_max)
     
+    def iter_inorden_desde(self, x, y=None, estricto=False):
+        """
+        Generador en orden (x, y) que empieza en el primer obstáculo con clave >= (x, y)
+        (o > si estricto). Con y=None solo se compara la coordenada x. Usa una pila
+        explícita: llegar al inicio cuesta O(log n) y cada paso siguiente O(1) amortizado.
+        El generador no es válido si el árbol se modifica mientras se recorre.
+        """
+        pila = []
+        nodo = self.raiz
+        while nodo:
+            obs = nodo.obstaculo
+            nodo_x = obs.x
+            if y is None:
+                va_despues = nodo_x > x or (nodo_x == x and not estricto)
+            else:
+                nodo_y = obs.y
+                va_despues = nodo_x > x or (nodo_x == x and (nodo_y > y or (nodo_y == y and not estricto)))
+            
+            if va_despues:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            else:
+                nodo = nodo.derecho
+        
+        yield from self._continuar_inorden(pila)
+    
+    def _continuar_inorden(self, pila):
+        """
+        Sigue un recorrido en orden a partir de una pila de nodos pendientes (el tope es el
+        siguiente a visitar; los de abajo son ancestros cuyo subárbol izquierdo se está recorriendo)
+        """
+        while pila:
+            nodo = pila.pop()
+            yield nodo.obstaculo
+            nodo = nodo.derecho
+            while nodo:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+    
+    def iter_inorden(self, desde=0):
+        """
+        Generador en orden (Izquierda -> Raíz -> Derecha) que empieza en la posición desde.
+        Usa el tamaño de los subárboles para saltar directo a esa posición en O(log n) en
+        lugar de recorrer los anteriores; cada paso siguiente es O(1) amortizado.
+        """
+        k = max(0, desde)
+        if k >= self.contar_nodos():
+            return
+        
+        pila = []
+        nodo = self.raiz
+        while nodo:
+            tamano_izq = self.tamano(nodo.izquierdo)
+            if k < tamano_izq:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            elif k == tamano_izq:
+                pila.append(nodo)
+                break
+            else:
+                k -= tamano_izq + 1
+                nodo = nodo.derecho
+        
+        yield from self._continuar_inorden(pila)
+    
+    def iter_preorden(self, desde=0):
+        """
+        Generador en preorden (Raíz -> Izquierda -> Derecha) que empieza en la posición desde.
+        La pila guarda los subárboles derechos pendientes de los ancestros.
+        """
+        k = max(0, desde)
+        if k >= self.contar_nodos():
+            return
+        
+        pila = []
+        nodo = self.raiz
+        # En preorden el nodo va primero, luego su subárbol izquierdo y después el derecho
+        while k > 0:
+            k -= 1
+            tamano_izq = self.tamano(nodo.izquierdo)
+            if k < tamano_izq:
+                if nodo.derecho:
+                    pila.append(nodo.derecho)
+                nodo = nodo.izquierdo
+            else:
+                k -= tamano_izq
+                nodo = nodo.derecho
+        pila.append(nodo)
+        
+        while pila:
+            nodo = pila.pop()
+            yield nodo.obstaculo
+            if nodo.derecho:
+                pila.append(nodo.derecho)
+            if nodo.izquierdo:
+                pila.append(nodo.izquierdo)
+    
+    def iter_postorden(self, desde=0):
+        """
+        Generador en postorden (Izquierda -> Derecha -> Raíz) que empieza en la posición desde.
+        La pila guarda pares (nodo, expandir): con expandir=True falta recorrer el subárbol
+        completo, con False solo falta visitar el nodo.
+        """
+        k = max(0, desde)
+        if k >= self.contar_nodos():
+            return
+        
+        pila = []
+        nodo = self.raiz
+        # En postorden van primero el subárbol izquierdo, luego el derecho y al final el nodo
+        while True:
+            tamano_izq = self.tamano(nodo.izquierdo)
+            tamano_der = self.tamano(nodo.derecho)
+            pila.append((nodo, False))
+            if k < tamano_izq:
+                if nodo.derecho:
+                    pila.append((nodo.derecho, True))
+                nodo = nodo.izquierdo
+            elif k < tamano_izq + tamano_der:
+                k -= tamano_izq
+                nodo = nodo.derecho
+            else:
+                break
+        
+        while pila:
+            nodo, expandir = pila.pop()
+            if not expandir:
+                yield nodo.obstaculo
+                continue
+            pila.append((nodo, False))
+            if nodo.derecho:
+                pila.append((nodo.derecho, True))
+            if nodo.izquierdo:
+                pila.append((nodo.izquierdo, True))
+    
     def recorrido_inorden(self):
         """Recorrido en orden del árbol para mostrar obstáculos ordenados"""
-        obstaculos = []
-        self._inorden_recursivo(self.raiz, obstaculos)
-        return obstaculos
-    
-    def _inorden_recursivo(self, nodo, obstaculos):
-        """Función recursiva para recorrido en orden"""
-        if nodo:
-            self._inorden_recursivo(nodo.izquierdo, obstaculos)
-            obstaculos.append(nodo.obstaculo)
-            self._inorden_recursivo(nodo.derecho, obstaculos)
+        return list(self.iter_inorden())
     
-    def mostrar_estructura(self, nodo=None, nivel=0, prefijo="Raíz: "):
-        """Muestra la estructura del árbol para debugging"""
+    def lineas_estructura(self, nodo=None, nivel=0, prefijo="Raíz: "):
+        """Genera las líneas de texto con la estructura del árbol (para debugging)"""
         if nodo is None:
             nodo = self.raiz
         
         if nodo is not None:
-            print(" " * (nivel * 4) + prefijo + str(nodo.obstaculo) + f" (h={nodo.altura}, b={self.factor_balance(nodo)})")
+            yield " " * (nivel * 4) + prefijo + str(nodo.obstaculo) + f" (h={nodo.altura}, n={nodo.tamano}, b={self.factor_balance(nodo)})"
             if nodo.izquierdo or nodo.derecho:
                 if nodo.izquierdo:
-                    self.mostrar_estructura(nodo.izquierdo, nivel + 1, "I--- ")
+                    yield from self.lineas_estructura(nodo.izquierdo, nivel + 1, "I--- ")
                 else:
-                    print(" " * ((nivel + 1) * 4) + "I--- None")
+                    yield " " * ((nivel + 1) * 4) + "I--- None"
                 
                 if nodo.derecho:
-                    self.mostrar_estructura(nodo.derecho, nivel + 1, "D--- ")
+                    yield from self.lineas_estructura(nodo.derecho, nivel + 1, "D--- ")
                 else:
-                    print(" " * ((nivel + 1) * 4) + "D--- None")
+                    yield " " * ((nivel + 1) * 4) + "D--- None"
+    
+    def mostrar_estructura(self, nodo=None, nivel=0, prefijo="Raíz: "):
+        """Muestra la estructura del árbol para debugging"""
+        for linea in self.lineas_estructura(nodo, nivel, prefijo):
+            print(linea)
     
     def obtener_altura(self):
         """Obtiene la altura total del árbol"""
         return self.altura(self.raiz)
     
     def contar_nodos(self):
-        """Cuenta el total de nodos en el árbol"""
-        return self._contar_recursivo(self.raiz)
+        """Cuenta el total de nodos en el árbol (O(1) gracias al tamaño de subárbol)"""
+        return self.tamano(self.raiz)
     
-    def _contar_recursivo(self, nodo):
-        """Función recursiva para contar nodos"""
-        if not nodo:
-            return 0
-        return 1 + self._contar_recursivo(nodo.izquierdo) + self._contar_recursivo(nodo.derecho)
+    def obtener_estadisticas(self):
+        """
+        Estadísticas actuales del árbol sin recorrerlo: todo se mantiene al insertar y
+        eliminar, así que se puede consultar cada frame desde el HUD o el visualizador
+        """
+        altura = self.obtener_altura()
+        total_nodos = self.contar_nodos()
+        altura_ideal = max(1, total_nodos.bit_length() - 1) if total_nodos > 0 else 1
+        return {
+            'nodos': total_nodos,
+            'altura': altura,
+            'altura_ideal': altura_ideal,
+            'eficiencia': (altura_ideal / altura * 100) if altura > 0 else 100,
+            'por_tipo': dict(self.por_tipo),
+            'rotaciones': dict(self.rotaciones),
+            'inserciones': self.total_inserciones,
+            'eliminaciones': self.total_eliminaciones,
+            'version': self.version,
+        }
+    
+    def exportar_estadisticas(self, ruta):
+        """Guarda las estadísticas del árbol en un archivo JSON"""
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(self.obtener_estadisticas(), f, indent=2, ensure_ascii=False)
+    
+    def seleccionar(self, k):
+        """Obtiene el k-ésimo obstáculo en orden (x, y), empezando en 0. None si k está fuera de rango"""
+        if k < 0:
+            return None
+        nodo = self.raiz
+        while nodo:
+            tamano_izq = self.tamano(nodo.izquierdo)
+            if k < tamano_izq:
+                nodo = nodo.izquierdo
+            elif k == tamano_izq:
+                return nodo.obstaculo
+            else:
+                k -= tamano_izq + 1
+                nodo = nodo.derecho
+        return None
+    
+    def contar_menores_que(self, x):
+        """Cuenta los obstáculos con coordenada x menor al valor dado en O(log n)"""
+        cantidad = 0
+        nodo = self.raiz
+        while nodo:
+            if nodo.obstaculo.x < x:
+                cantidad += self.tamano(nodo.izquierdo) + 1
+                nodo = nodo.derecho
+            else:
+                nodo = nodo.izquierdo
+        return cantidad
     
     def recorrido_preorden(self):
         """Recorrido en preorden del árbol (Raíz -> Izquierda -> Derecha)"""
-        obstaculos = []
-        self._preorden_recursivo(self.raiz, obstaculos)
-        return obstaculos
-    
-    def _preorden_recursivo(self, nodo, obstaculos):
-        """Función recursiva para recorrido en preorden"""
-        if nodo:
-            obstaculos.append(nodo.obstaculo)  # Visitar raíz primero
-            self._preorden_recursivo(nodo.izquierdo, obstaculos)
-            self._preorden_recursivo(nodo.derecho, obstaculos)
+        return list(self.iter_preorden())
     
     def recorrido_postorden(self):
         """Recorrido en postorden del árbol (Izquierda -> Derecha -> Raíz)"""
-        obstaculos = []
-        self._postorden_recursivo(self.raiz, obstaculos)
-        return obstaculos
-    
-    def _postorden_recursivo(self, nodo, obstaculos):
-        """Función recursiva para recorrido en postorden"""
-        if nodo:
-            self._postorden_recursivo(nodo.izquierdo, obstaculos)
-            self._postorden_recursivo(nodo.derecho, obstaculos)
-            obstaculos.append(nodo.obstaculo)  # Visitar raíz al final
\ No newline at end of file
+        return list(self.iter_postorden())
\ No newline at end of file
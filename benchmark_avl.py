@@ -0,0 +1,358 @@
+"""
+📈 Benchmark del Árbol AVL de obstáculos
+
+Mide cómo escalan las operaciones de ArbolAVL con árboles de 10^3 a 10^6 obstáculos
+generados aleatoriamente (con semilla fija para que las corridas sean comparables).
+Para cada operación reporta ops/seg y asignaciones de memoria (tracemalloc), y guarda
+los resultados en JSON para compararlos con corridas anteriores.
+
+Uso:
+    python benchmark_avl.py
+    python benchmark_avl.py --tamanos 1000 10000 --salida base.json
+    python benchmark_avl.py --comparar base.json --umbral 0.15
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+
+from avl_tree import ArbolAVL, NodoAVL
+from registro_obstaculo import RegistroObstaculo
+
+TIPOS = ['roca', 'cono', 'hueco', 'aceite']
+TAMANOS_POR_DEFECTO = [1_000, 10_000, 100_000, 1_000_000]
+CONSULTAS_POR_OPERACION = 1_000
+ANCHO_PANTALLA = 1000
+
+def generar_obstaculos(n, semilla):
+    """Genera n obstáculos con coordenadas (x, y) únicas en orden aleatorio"""
+    rng = random.Random(semilla)
+    xs = rng.sample(range(n * 10), n)
+    return [RegistroObstaculo(x, rng.randrange(6), rng.choice(TIPOS)) for x in xs]
+
+def construir_arbol(obstaculos):
+    """Construye un árbol insertando los obstáculos uno a uno"""
+    arbol = ArbolAVL()
+    for obs in obstaculos:
+        arbol.insertar(obs)
+    return arbol
+
+# Versiones recursivas originales de insertar y eliminar, conservadas solo como línea
+# base. Trabajan sobre los nodos de un árbol aparte: no actualizan version, por_tipo
+# ni los totales de inserciones y eliminaciones.
+
+def insertar_recursivo(arbol, nodo, obstaculo):
+    """Inserción recursiva original; devuelve la nueva raíz del subárbol"""
+    # Paso 1: Inserción normal de BST
+    if not nodo:
+        return NodoAVL(obstaculo)
+    
+    # Comparar primero por x, luego por y en caso de empate
+    if obstaculo.x < nodo.obstaculo.x:
+        nodo.izquierdo = insertar_recursivo(arbol, nodo.izquierdo, obstaculo)
+    elif obstaculo.x > nodo.obstaculo.x:
+        nodo.derecho = insertar_recursivo(arbol, nodo.derecho, obstaculo)
+    else:  # x es igual, comparar por y
+        if obstaculo.y < nodo.obstaculo.y:
+            nodo.izquierdo = insertar_recursivo(arbol, nodo.izquierdo, obstaculo)
+        elif obstaculo.y > nodo.obstaculo.y:
+            nodo.derecho = insertar_recursivo(arbol, nodo.derecho, obstaculo)
+        else:
+            # No se permiten coordenadas repetidas
+            return nodo
+    
+    # Paso 2: Actualizar altura del nodo actual
+    arbol.actualizar_altura(nodo)
+    
+    # Paso 3: Obtener factor de balance
+    balance = arbol.factor_balance(nodo)
+    
+    # Paso 4: Si el nodo está desbalanceado, hay 4 casos
+    
+    # Caso Izquierda-Izquierda
+    if balance > 1 and ((obstaculo.x < nodo.izquierdo.obstaculo.x) or 
+                       (obstaculo.x == nodo.izquierdo.obstaculo.x and 
+                        obstaculo.y < nodo.izquierdo.obstaculo.y)):
+        return arbol.rotar_derecha(nodo)
+    
+    # Caso Derecha-Derecha
+    if balance < -1 and ((obstaculo.x > nodo.derecho.obstaculo.x) or 
+                        (obstaculo.x == nodo.derecho.obstaculo.x and 
+                         obstaculo.y > nodo.derecho.obstaculo.y)):
+        return arbol.rotar_izquierda(nodo)
+    
+    # Caso Izquierda-Derecha
+    if balance > 1 and ((obstaculo.x > nodo.izquierdo.obstaculo.x) or 
+                       (obstaculo.x == nodo.izquierdo.obstaculo.x and 
+                        obstaculo.y > nodo.izquierdo.obstaculo.y)):
+        nodo.izquierdo = arbol.rotar_izquierda(nodo.izquierdo)
+        return arbol.rotar_derecha(nodo)
+    
+    # Caso Derecha-Izquierda
+    if balance < -1 and ((obstaculo.x < nodo.derecho.obstaculo.x) or 
+                        (obstaculo.x == nodo.derecho.obstaculo.x and 
+                         obstaculo.y < nodo.derecho.obstaculo.y)):
+        nodo.derecho = arbol.rotar_derecha(nodo.derecho)
+        return arbol.rotar_izquierda(nodo)
+    
+    # Retornar nodo sin cambios
+    return nodo
+
+def eliminar_recursivo(arbol, nodo, x, y):
+    """Eliminación recursiva original; devuelve la nueva raíz del subárbol"""
+    if not nodo:
+        return nodo
+    
+    # Buscar el nodo a eliminar
+    if x < nodo.obstaculo.x:
+        nodo.izquierdo = eliminar_recursivo(arbol, nodo.izquierdo, x, y)
+    elif x > nodo.obstaculo.x:
+        nodo.derecho = eliminar_recursivo(arbol, nodo.derecho, x, y)
+    else:  # x es igual
+        if y < nodo.obstaculo.y:
+            nodo.izquierdo = eliminar_recursivo(arbol, nodo.izquierdo, x, y)
+        elif y > nodo.obstaculo.y:
+            nodo.derecho = eliminar_recursivo(arbol, nodo.derecho, x, y)
+        else:
+            # Este es el nodo a eliminar
+            if not nodo.izquierdo:
+                return nodo.derecho
+            elif not nodo.derecho:
+                return nodo.izquierdo
+            
+            # Nodo con dos hijos - obtener sucesor
+            temp = arbol._obtener_minimo(nodo.derecho)
+            nodo.obstaculo = temp.obstaculo
+            nodo.derecho = eliminar_recursivo(arbol, nodo.derecho, 
+                                              temp.obstaculo.x, 
+                                              temp.obstaculo.y)
+    
+    # Actualizar altura y rebalancear
+    arbol.actualizar_altura(nodo)
+    balance = arbol.factor_balance(nodo)
+    
+    # Rebalancear si es necesario
+    if balance > 1 and arbol.factor_balance(nodo.izquierdo) >= 0:
+        return arbol.rotar_derecha(nodo)
+    
+    if balance > 1 and arbol.factor_balance(nodo.izquierdo) < 0:
+        nodo.izquierdo = arbol.rotar_izquierda(nodo.izquierdo)
+        return arbol.rotar_derecha(nodo)
+    
+    if balance < -1 and arbol.factor_balance(nodo.derecho) <= 0:
+        return arbol.rotar_izquierda(nodo)
+    
+    if balance < -1 and arbol.factor_balance(nodo.derecho) > 0:
+        nodo.derecho = arbol.rotar_derecha(nodo.derecho)
+        return arbol.rotar_izquierda(nodo)
+    
+    return nodo
+
+def construir_arbol_recursivo(obstaculos):
+    """Construye un árbol con la inserción recursiva original (para comparar)"""
+    arbol = ArbolAVL()
+    for obs in obstaculos:
+        arbol.raiz = insertar_recursivo(arbol, arbol.raiz, obs)
+    return arbol
+
+def preparar_operaciones(n, semilla):
+    """
+    Devuelve un diccionario nombre -> (despues, ejecutar, num_ops).
+    ejecutar() es la parte que se mide (devuelve lo que produce la operación) y
+    despues(), si existe, restaura el árbol fuera de la medición.
+    """
+    obstaculos = generar_obstaculos(n, semilla)
+    arbol = construir_arbol(obstaculos)
+    rng = random.Random(semilla + 1)
+    consultas = min(CONSULTAS_POR_OPERACION, n)
+    x_max = n * 10
+
+    muestra = rng.sample(obstaculos, consultas)
+    rangos = []
+    for _ in range(consultas):
+        x_min = rng.randrange(x_max)
+        rangos.append((x_min, x_min + ANCHO_PANTALLA))
+    posiciones = [rng.randrange(x_max) for _ in range(consultas)]
+
+    def ejecutar_insertar(_):
+        return construir_arbol(obstaculos)
+
+    def ejecutar_eliminar(_):
+        for obs in muestra:
+            arbol.eliminar(obs.x, obs.y)
+
+    def ejecutar_insertar_recursivo(_):
+        return construir_arbol_recursivo(obstaculos)
+
+    def restaurar_eliminados():
+        # Volver a insertar lo eliminado para que cada repetición parta del mismo tamaño
+        for obs in muestra:
+            arbol.insertar(obs)
+
+    # La línea base recursiva elimina y restaura sobre su propio árbol
+    arbol_recursivo = construir_arbol_recursivo(obstaculos)
+
+    def ejecutar_eliminar_recursivo(_):
+        for obs in muestra:
+            arbol_recursivo.raiz = eliminar_recursivo(arbol_recursivo, arbol_recursivo.raiz, obs.x, obs.y)
+
+    def restaurar_eliminados_recursivo():
+        for obs in muestra:
+            arbol_recursivo.raiz = insertar_recursivo(arbol_recursivo, arbol_recursivo.raiz, obs)
+
+    # Límite que deja atrás los primeros `consultas` obstáculos (como la limpieza por frame)
+    x_limite = sorted(obs.x for obs in obstaculos)[consultas - 1] + 1
+
+    def ejecutar_eliminar_menores(_):
+        return arbol.eliminar_menores_que(x_limite)
+
+    def restaurar_menores():
+        for obs in obstaculos:
+            if obs.x < x_limite:
+                arbol.insertar(obs)
+
+    def ejecutar_rango(_):
+        return [arbol.buscar_en_rango(x_min, x_max_rango, 0, 600) for x_min, x_max_rango in rangos]
+
+    def ejecutar_visibles(_):
+        return [arbol.obtener_obstaculos_visibles(x, ANCHO_PANTALLA) for x in posiciones]
+
+    return {
+        # Los bytes retenidos de generar_obstaculos e insertar son la memoria de los
+        # registros y de los nodos del árbol respectivamente (dividir por n)
+        'generar_obstaculos': (None, lambda _: generar_obstaculos(n, semilla), n),
+        'insertar': (None, ejecutar_insertar, n),
+        'insertar_recursivo': (None, ejecutar_insertar_recursivo, n),
+        'desde_lista': (None, lambda _: ArbolAVL.desde_lista(obstaculos), n),
+        'eliminar': (restaurar_eliminados, ejecutar_eliminar, consultas),
+        'eliminar_recursivo': (restaurar_eliminados_recursivo, ejecutar_eliminar_recursivo, consultas),
+        'eliminar_menores_que': (restaurar_menores, ejecutar_eliminar_menores, consultas),
+        'buscar_en_rango': (None, ejecutar_rango, consultas),
+        'obtener_obstaculos_visibles': (None, ejecutar_visibles, consultas),
+        'recorrido_inorden': (None, lambda _: arbol.recorrido_inorden(), n),
+        'recorrido_preorden': (None, lambda _: arbol.recorrido_preorden(), n),
+        'recorrido_postorden': (None, lambda _: arbol.recorrido_postorden(), n),
+    }
+
+def medir(ejecutar, num_ops, repeticiones, despues=None, asignaciones=True):
+    """
+    Mide una operación: mejor tiempo de varias repeticiones y, en una pasada aparte,
+    la memoria que asigna (pico) y la que retiene su resultado (bloques y bytes)
+    """
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        ejecutar(None)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        if despues:
+            despues()
+
+    resultado = {
+        'ops': num_ops,
+        'segundos': mejor,
+        'ops_por_segundo': num_ops / mejor if mejor > 0 else float('inf'),
+    }
+
+    if asignaciones:
+        # Pasada aparte: tracemalloc distorsiona los tiempos
+        tracemalloc.start()
+        antes = tracemalloc.take_snapshot()
+        memoria_antes, _ = tracemalloc.get_traced_memory()
+        retenido = ejecutar(None)
+        memoria_despues, pico = tracemalloc.get_traced_memory()
+        despues_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        del retenido
+        if despues:
+            despues()
+
+        diferencias = despues_snapshot.compare_to(antes, 'filename')
+        resultado['bloques_retenidos'] = sum(max(0, d.count_diff) for d in diferencias)
+        resultado['bytes_retenidos'] = max(0, memoria_despues - memoria_antes)
+        resultado['bytes_pico'] = pico - memoria_antes
+
+    return resultado
+
+def ejecutar_benchmark(tamanos, repeticiones, semilla, asignaciones=True, operaciones=None):
+    """Ejecuta todas las operaciones para cada tamaño de árbol"""
+    resultados = {}
+    for n in tamanos:
+        print(f"\n=== n = {n:,} obstáculos ===")
+        resultados[str(n)] = {}
+        for nombre, (despues, ejecutar, num_ops) in preparar_operaciones(n, semilla).items():
+            if operaciones and nombre not in operaciones:
+                continue
+            medicion = medir(ejecutar, num_ops, repeticiones, despues, asignaciones)
+            resultados[str(n)][nombre] = medicion
+
+            linea = f"  {nombre:<30} {medicion['ops_por_segundo']:>14,.0f} ops/s"
+            if asignaciones:
+                linea += (f" | {medicion['bloques_retenidos']:>10,} bloques"
+                          f" | pico {medicion['bytes_pico'] / 1024:>10,.1f} KiB")
+            print(linea)
+    return resultados
+
+def comparar(actual, anterior, umbral):
+    """Compara ops/seg con una corrida anterior y devuelve las regresiones encontradas"""
+    regresiones = []
+    for n, operaciones in actual['resultados'].items():
+        for nombre, medicion in operaciones.items():
+            base = anterior['resultados'].get(n, {}).get(nombre)
+            if not base:
+                continue
+            cambio = medicion['ops_por_segundo'] / base['ops_por_segundo'] - 1
+            marca = "⚠️ " if cambio < -umbral else "  "
+            print(f"{marca}n={n:>8} {nombre:<30} {cambio:+.1%}")
+            if cambio < -umbral:
+                regresiones.append((n, nombre, cambio))
+    return regresiones
+
+def main():
+    """Punto de entrada del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de operaciones del Árbol AVL")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS_POR_DEFECTO,
+                        help="Tamaños de árbol a medir")
+    parser.add_argument('--repeticiones', type=int, default=3, help="Repeticiones por operación (se toma la mejor)")
+    parser.add_argument('--semilla', type=int, default=42, help="Semilla para generar obstáculos")
+    parser.add_argument('--operaciones', nargs='+', default=None, help="Medir solo estas operaciones")
+    parser.add_argument('--sin-asignaciones', action='store_true', help="No medir asignaciones (más rápido)")
+    parser.add_argument('--salida', default='benchmark_avl.json', help="Archivo JSON de resultados")
+    parser.add_argument('--comparar', default=None, help="JSON de una corrida anterior para detectar regresiones")
+    parser.add_argument('--umbral', type=float, default=0.10,
+                        help="Caída de ops/seg tolerada antes de marcar regresión (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    resultados = ejecutar_benchmark(args.tamanos, args.repeticiones, args.semilla,
+                                    not args.sin_asignaciones, args.operaciones)
+    reporte = {
+        'meta': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'semilla': args.semilla,
+            'repeticiones': args.repeticiones,
+        },
+        'resultados': resultados,
+    }
+
+    with open(args.salida, 'w', encoding='utf-8') as f:
+        json.dump(reporte, f, indent=2)
+    print(f"\n💾 Resultados guardados en {args.salida}")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            anterior = json.load(f)
+        print(f"\n=== Comparación con {args.comparar} ===")
+        regresiones = comparar(reporte, anterior, args.umbral)
+        if regresiones:
+            print(f"\n❌ {len(regresiones)} regresiones por encima del {args.umbral:.0%}")
+            sys.exit(1)
+        print("\n✅ Sin regresiones")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Bitácora del juego: mensajes por nivel sin frenar el bucle de frames
+Los módulos piden su logger con obtener_bitacora() y escriben con formato perezoso
+(log.info("Energía: %s", energia)): si el nivel está desactivado el mensaje ni se arma.
+Los mensajes habilitados pasan por una cola y un hilo en segundo plano los escribe en
+consola, así el frame no espera a la terminal; además se guardan los últimos en memoria.
+Por defecto solo se muestran advertencias y errores (nivel_bitacora en config.json o la
+variable de entorno CARRITO_BITACORA, que tiene prioridad).
+"""
+
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from collections import deque
+
+NOMBRE_RAIZ = 'carrito'
+NIVEL_POR_DEFECTO = 'WARNING'
+CAPACIDAD_MEMORIA = 1000
+VARIABLE_ENTORNO = 'CARRITO_BITACORA'
+
+class BufferCircular(logging.Handler):
+    """Guarda los últimos registros en memoria; el texto se arma solo al leerlos"""
+    def __init__(self, capacidad=CAPACIDAD_MEMORIA):
+        super().__init__()
+        self.registros = deque(maxlen=capacidad)
+
+    def emit(self, record):
+        self.registros.append(record)
+
+    def mensajes(self, cantidad=None):
+        """Devuelve los últimos mensajes formateados (todos si cantidad es None)"""
+        registros = list(self.registros)
+        if cantidad is not None:
+            registros = registros[-cantidad:]
+        return [self.format(registro) for registro in registros]
+
+class _ConsolaActual(logging.StreamHandler):
+    """Escribe en el sys.stdout vigente (respeta redirect_stdout de la simulación headless)"""
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
+
+_oyente = None        # QueueListener que escribe en consola desde su propio hilo
+_manejador_cola = None
+_memoria = None
+
+def configurar_bitacora(nivel=NIVEL_POR_DEFECTO, capacidad_memoria=CAPACIDAD_MEMORIA):
+    """Prepara los handlers la primera vez y ajusta el nivel; se puede llamar varias veces"""
+    global _oyente, _manejador_cola, _memoria
+
+    raiz = logging.getLogger(NOMBRE_RAIZ)
+    nivel = os.environ.get(VARIABLE_ENTORNO, nivel)
+    raiz.setLevel(nivel.upper() if isinstance(nivel, str) else nivel)
+
+    if _memoria is None:
+        _memoria = BufferCircular(capacidad_memoria)
+        _memoria.setFormatter(logging.Formatter('%(relativeCreated)8.0f ms %(levelname)-7s %(name)s: %(message)s'))
+        raiz.addHandler(_memoria)
+        raiz.propagate = False
+        atexit.register(detener_bitacora)
+
+    if _oyente is None:
+        cola = queue.SimpleQueue()
+        consola = _ConsolaActual(sys.stdout)
+        consola.setFormatter(logging.Formatter('%(message)s'))
+        _oyente = logging.handlers.QueueListener(cola, consola)
+        _oyente.start()
+        _manejador_cola = logging.handlers.QueueHandler(cola)
+        raiz.addHandler(_manejador_cola)
+    return raiz
+
+def obtener_bitacora(nombre):
+    """Logger de un módulo del juego (hijo de 'carrito')"""
+    return logging.getLogger(f"{NOMBRE_RAIZ}.{nombre}")
+
+def ultimos_mensajes(cantidad=None):
+    """Últimos mensajes guardados en memoria (útil al investigar un error)"""
+    return _memoria.mensajes(cantidad) if _memoria else []
+
+def detener_bitacora():
+    """Escribe los mensajes pendientes y detiene el hilo de la bitácora"""
+    global _oyente, _manejador_cola
+    if _oyente is not None:
+        logging.getLogger(NOMBRE_RAIZ).removeHandler(_manejador_cola)
+        _oyente.stop()
+        _oyente = None
+        _manejador_cola = None
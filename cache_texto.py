@@ -0,0 +1,59 @@
+"""
+Caché LRU de textos renderizados
+Los textos del HUD, menús y overlays cambian muy poco entre frames: en lugar de llamar a
+font.render() cada frame, se reutiliza la superficie ya renderizada para la misma
+combinación (fuente, texto, color, antialias). Las superficies devueltas son compartidas
+y no deben modificarse.
+"""
+
+from collections import OrderedDict
+
+CAPACIDAD_POR_DEFECTO = 512
+
+class CacheTexto:
+    """Caché de superficies de texto con desalojo LRU y contadores de aciertos/fallos"""
+    def __init__(self, capacidad=CAPACIDAD_POR_DEFECTO):
+        self.capacidad = capacidad
+        self._superficies = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def renderizar(self, fuente, texto, antialias, color):
+        """Igual que fuente.render(texto, antialias, color), pero cacheado"""
+        clave = (fuente, texto, tuple(color), antialias)
+        superficie = self._superficies.get(clave)
+        if superficie is not None:
+            self.aciertos += 1
+            self._superficies.move_to_end(clave)
+            return superficie
+
+        self.fallos += 1
+        superficie = fuente.render(texto, antialias, color)
+        self._superficies[clave] = superficie
+        if len(self._superficies) > self.capacidad:
+            self._superficies.popitem(last=False)  # Desalojar el menos usado recientemente
+        return superficie
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores"""
+        self._superficies.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def estadisticas(self):
+        """Devuelve el estado de la caché (tamaño, aciertos, fallos y tasa de aciertos)"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'tamano': len(self._superficies),
+            'capacidad': self.capacidad,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
+
+# Caché compartida por el juego, el menú y el visualizador
+CACHE_TEXTO = CacheTexto()
+
+def renderizar_texto(fuente, texto, antialias, color):
+    """Renderiza un texto usando la caché compartida"""
+    return CACHE_TEXTO.renderizar(fuente, texto, antialias, color)
@@ -1,9 +1,16 @@
 import pygame
+from graficos import adaptar_a_pantalla
 
 # Colores para el carrito
 BLUE = (0, 0, 255)
 RED = (255, 0, 0)
 WHITE = (255, 255, 255)
+COLOR_TRANSPARENTE = (255, 0, 255)  # Color clave de los sprites (no se dibuja)
+
+# Física del salto en unidades por segundo, para que no dependa de ticks_por_segundo:
+# el salto dura 2 * VELOCIDAD_SALTO / GRAVEDAD_SALTO = 0.5 s y sube hasta 120 píxeles
+VELOCIDAD_SALTO = 960.0   # Velocidad inicial (píxeles/s)
+GRAVEDAD_SALTO = 3840.0   # Píxeles/s²
 
 # Mapeo de colores
 COLOR_MAP = {
@@ -35,6 +42,11 @@ class Carrito:
         # Variables de salto
         self.salto_velocidad = 0
         self.en_salto = False
+        
+        # Sprites pre-renderizados por (color, saltando, tamaño)
+        self._sprites = {}
+        self._clave_sprite = None
+        self._sprite_actual = None
     
     def get_screen_position(self, carretera_y=200, carretera_height=200):
         """Convierte la posición lógica a coordenadas de pantalla"""
@@ -65,14 +77,16 @@ class Carrito:
         """Inicia el salto del carrito"""
         if not self.saltando:
             self.saltando = True
-            self.salto_velocidad = 15  # Velocidad inicial del salto
+            self.salto_velocidad = VELOCIDAD_SALTO
             self.color_actual = RED  # Cambiar color durante el salto
     
-    def actualizar_salto(self):
-        """Actualiza la física del salto"""
+    def actualizar_salto(self, dt):
+        """Avanza la física del salto dt segundos"""
         if self.saltando:
-            self.altura_salto += self.salto_velocidad
-            self.salto_velocidad -= 1  # Gravedad
+            # Integración exacta con gravedad constante: la trayectoria es la misma con
+            # cualquier paso, solo cambia en qué instantes se muestrea
+            self.altura_salto += self.salto_velocidad * dt - 0.5 * GRAVEDAD_SALTO * dt * dt
+            self.salto_velocidad -= GRAVEDAD_SALTO * dt
             
             # Si toca el suelo, termina el salto
             if self.altura_salto <= 0:
@@ -155,9 +169,45 @@ class Carrito:
                                (x - half_w + 3 - i*2, y - half_h + 5 + i, 
                                 ancho - 6, alto - 10), 1)
     
+    def _margen_sprite(self):
+        """Espacio alrededor del carrito dentro del sprite (ruedas, faros y estela del salto)"""
+        return self.size // 4
+    
+    def obtener_sprite(self):
+        """
+        Obtiene el sprite del estado actual del carrito.
+        Solo se vuelve a buscar (o a renderizar) cuando cambia color_actual, el salto o size.
+        """
+        clave = (self.color_actual, self.saltando, self.size)
+        if clave != self._clave_sprite:
+            sprite = self._sprites.get(clave)
+            if sprite is None:
+                sprite = self._renderizar_sprite()
+                self._sprites[clave] = sprite
+            self._clave_sprite = clave
+            self._sprite_actual = sprite
+        return self._sprite_actual
+    
+    def _renderizar_sprite(self):
+        """Dibuja el carrito una vez sobre una superficie con color clave transparente"""
+        lado = self.size + 2 * self._margen_sprite()
+        sprite = pygame.Surface((lado, lado))
+        sprite.fill(COLOR_TRANSPARENTE)
+        self.dibujar_carrito_programatico(sprite, lado // 2, lado // 2)
+        sprite.set_colorkey(COLOR_TRANSPARENTE)
+        return adaptar_a_pantalla(sprite)
+    
+    def obtener_rect(self):
+        """Rectángulo de pantalla que ocupa el sprite del carrito"""
+        x, y = self.get_screen_position()
+        centro = self.size // 2 + self._margen_sprite()
+        lado = self.size + 2 * self._margen_sprite()
+        return pygame.Rect(x - centro, y - centro, lado, lado)
+    
     def draw(self, screen):
         """Dibuja el carrito en pantalla"""
         x, y = self.get_screen_position()
         
-        # Dibujar carrito programáticamente (¡mucho mejor que un cuadrado!)
-        self.dibujar_carrito_programatico(screen, x, y)
\ No newline at end of file
+        # Un solo blit del sprite cacheado (dibujado programáticamente una vez por estado)
+        centro = self.size // 2 + self._margen_sprite()
+        screen.blit(self.obtener_sprite(), (x - centro, y - centro))
\ No newline at end of file
@@ -7,8 +7,10 @@ Arquitectura modular para mejor mantenimiento y organización del código.
 
 import pygame
 import sys
+import argparse
 from menu import MenuPrincipal
 from juego import JuegoCarrito
+from grabacion import GrabacionEntradas
 
 # Constantes globales
 SCREEN_WIDTH = 1000
@@ -22,6 +24,12 @@ def main():
     Función principal que maneja el ciclo completo del programa:
     Menú Principal → Juego → Menú Principal (loop continuo)
     """
+    parser = argparse.ArgumentParser(description="Carrito AVL - Juego de obstáculos dinámicos")
+    parser.add_argument('--grabar', default=None, help="Grabar las teclas de cada partida en este archivo")
+    parser.add_argument('--reproducir', default=None, help="Reproducir una partida grabada y salir")
+    parser.add_argument('--perfil', default=None, help="Activar el perfilador y guardar sus tiempos en este archivo JSON")
+    args = parser.parse_args()
+    
     # Crear pantalla principal
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("🚗 Carrito AVL - Obstáculos Dinámicos 🌳")
@@ -35,6 +43,21 @@ def main():
     print("   - avl_tree.py: Implementación del Árbol AVL")
     print("   - visualizador_pygame.py: Visualizaciones integradas")
     
+    if args.reproducir:
+        # Reproducir la partida en la ventana, a la velocidad original
+        print(f"▶️  Reproduciendo {args.reproducir}...")
+        juego = JuegoCarrito()
+        if args.perfil:
+            juego.perfilador.alternar()
+        resumen = juego.reproducir(GrabacionEntradas.cargar(args.reproducir),
+                                   dibujar=True, tiempo_real=True)
+        print(f"⏹️  Reproducción terminada: {resumen['ticks']} ticks, {resumen['teclas']} teclas")
+        if args.perfil:
+            juego.perfilador.exportar(args.perfil)
+            print(f"⏱ Perfil de frames guardado en {args.perfil}")
+        pygame.quit()
+        sys.exit()
+    
     # Bucle principal del programa
     while True:
         # Mostrar menú principal
@@ -48,7 +71,7 @@ def main():
             # Iniciar juego
             print("🎯 Iniciando juego...")
             juego = JuegoCarrito()
-            juego.run()
+            juego.run(grabar=args.grabar, perfil=args.perfil)
             print("🔙 Regresando al menú principal...")
             # Después del juego, volver al menú automáticamente
     
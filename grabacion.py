@@ -0,0 +1,57 @@
+"""
+Grabación y reproducción de entradas del jugador
+Guarda cada tecla presionada junto con el tick de simulación en que se aplicó, en un
+archivo binario compacto. Como la simulación avanza en ticks fijos sobre un reloj virtual,
+volver a aplicar las mismas teclas en los mismos ticks reproduce la partida exacta
+(incluidas las inserciones de obstáculos), siempre que se use el mismo config.json.
+
+Formato del archivo (little-endian):
+    cabecera: magia b'CARR', versión (u8), reloj inicial (f64), ticks por segundo (u16),
+              total de ticks (u32)
+    eventos:  tick (u32), tecla (i32), carácter unicode (u32, 0 si no hay)
+"""
+
+import struct
+
+MAGIA = b'CARR'
+VERSION_FORMATO = 2  # 2: física del salto en unidades por segundo (las de la 1 ya no se reproducen igual)
+FORMATO_CABECERA = struct.Struct('<4sBdHI')
+FORMATO_EVENTO = struct.Struct('<IiI')
+
+class GrabacionEntradas:
+    """Teclas presionadas durante una partida, con el tick en que se aplicaron"""
+    def __init__(self, reloj_inicial, ticks_por_segundo):
+        self.reloj_inicial = reloj_inicial
+        self.ticks_por_segundo = ticks_por_segundo
+        self.total_ticks = 0
+        self.eventos = []  # (tick, tecla, carácter)
+
+    def registrar(self, tick, event):
+        """Agrega un evento KEYDOWN aplicado antes de ejecutar el tick indicado"""
+        caracter = ord(event.unicode[0]) if getattr(event, 'unicode', '') else 0
+        self.eventos.append((tick, event.key, caracter))
+
+    def guardar(self, ruta):
+        """Escribe la grabación en un archivo binario"""
+        with open(ruta, 'wb') as f:
+            f.write(FORMATO_CABECERA.pack(MAGIA, VERSION_FORMATO, self.reloj_inicial,
+                                          self.ticks_por_segundo, self.total_ticks))
+            f.write(b''.join(FORMATO_EVENTO.pack(*evento) for evento in self.eventos))
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Lee una grabación guardada con guardar()"""
+        with open(ruta, 'rb') as f:
+            datos = f.read()
+
+        if len(datos) < FORMATO_CABECERA.size:
+            raise ValueError(f"{ruta} no es una grabación válida")
+        magia, version, reloj_inicial, ticks_por_segundo, total_ticks = \
+            FORMATO_CABECERA.unpack_from(datos)
+        if magia != MAGIA or version != VERSION_FORMATO:
+            raise ValueError(f"{ruta} no es una grabación válida (versión {version})")
+
+        grabacion = cls(reloj_inicial, ticks_por_segundo)
+        grabacion.total_ticks = total_ticks
+        grabacion.eventos = list(FORMATO_EVENTO.iter_unpack(datos[FORMATO_CABECERA.size:]))
+        return grabacion
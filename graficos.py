@@ -0,0 +1,15 @@
+"""
+Utilidades gráficas compartidas por los sprites y fondos del juego
+"""
+
+import pygame
+
+def adaptar_a_pantalla(superficie, alpha=False):
+    """
+    Convierte una superficie al formato de la pantalla para que blit sea más rápido
+    (convert_alpha() si alpha es True, convert() si no). convert() necesita una pantalla
+    activa, que no existe en modo headless: en ese caso devuelve la superficie sin cambios.
+    """
+    if pygame.display.get_surface() is None:
+        return superficie
+    return superficie.convert_alpha() if alpha else superficie.convert()
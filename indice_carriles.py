@@ -0,0 +1,53 @@
+"""
+Índice secundario de obstáculos por carril
+Mantiene un Árbol AVL por carril con los mismos obstáculos que el árbol principal,
+para responder en O(log n) "cuál es el obstáculo más cercano por delante en este carril".
+"""
+
+from avl_tree import ArbolAVL
+
+class IndiceCarriles:
+    """Un Árbol AVL por carril, sincronizado con el árbol principal de obstáculos"""
+    def __init__(self, num_carriles=6):
+        self.arboles = [ArbolAVL() for _ in range(num_carriles)]
+
+    @classmethod
+    def desde_arbol(cls, arbol, num_carriles=6):
+        """Construye el índice a partir del árbol principal (construcción en bloque por carril)"""
+        indice = cls(num_carriles)
+        por_carril = [[] for _ in range(num_carriles)]
+        for obs in arbol.iter_inorden():
+            if 0 <= obs.y < num_carriles:
+                por_carril[obs.y].append(obs)
+        indice.arboles = [ArbolAVL.desde_lista(obstaculos) for obstaculos in por_carril]
+        return indice
+
+    def _arbol_de(self, carril):
+        """Obtiene el árbol de un carril (None si el carril no existe)"""
+        if 0 <= carril < len(self.arboles):
+            return self.arboles[carril]
+        return None
+
+    def insertar(self, obstaculo):
+        """Inserta un obstáculo en el árbol de su carril"""
+        arbol = self._arbol_de(obstaculo.y)
+        if arbol:
+            arbol.insertar(obstaculo)
+
+    def eliminar(self, obstaculo):
+        """Elimina un obstáculo del árbol de su carril"""
+        arbol = self._arbol_de(obstaculo.y)
+        if arbol:
+            arbol.eliminar(obstaculo.x, obstaculo.y)
+
+    def eliminar_menores_que(self, x_limite):
+        """Elimina de todos los carriles los obstáculos con x < x_limite"""
+        for arbol in self.arboles:
+            arbol.eliminar_menores_que(x_limite)
+
+    def primero_desde(self, carril, x, estricto=False):
+        """Obtiene el obstáculo más cercano del carril con x >= x (o > si estricto), o None"""
+        arbol = self._arbol_de(carril)
+        if not arbol:
+            return None
+        return next(arbol.iter_inorden_desde(x, estricto=estricto), None)
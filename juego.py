@@ -2,10 +2,23 @@ import pygame
 import sys
 import json
 import time
+import logging
 from avl_tree import ArbolAVL
 from visualizador_pygame import VisualizadorAVLPygame
 from carrito import Carrito
-from obstaculo import Obstaculo
+from obstaculo import Obstaculo, AREA_COLISION, dibujar_obstaculos
+from reloj import RelojVirtual
+from graficos import adaptar_a_pantalla
+from ventana_obstaculos import VentanaObstaculos
+from indice_carriles import IndiceCarriles
+from almacen_numpy import AlmacenObstaculosNumpy, NUMPY_DISPONIBLE
+from regiones_sucias import GestorRegionesSucias
+from cache_texto import renderizar_texto
+from grabacion import GrabacionEntradas
+from bitacora import configurar_bitacora, obtener_bitacora, NIVEL_POR_DEFECTO
+from perfilador import PerfiladorFrames
+
+log = obtener_bitacora('juego')
 
 # Constantes del juego
 SCREEN_WIDTH = 1000
@@ -14,6 +27,13 @@ CARRIL_WIDTH = 120  # Ancho de cada carril
 NUM_CARRILES = 6     # 3 carriles por cada lado
 CARRETERA_Y = 200    # Posición Y de la carretera
 CARRETERA_HEIGHT = 200  # Altura de la carretera
+PERIODO_LINEAS = 40  # Distancia entre el inicio de dos líneas divisorias consecutivas
+
+# Bucle de simulación con paso fijo
+TICKS_POR_SEGUNDO = 60   # Pasos de simulación por segundo (por defecto)
+FPS_RENDER = 60          # Límite de frames dibujados por segundo (0 = sin límite)
+MAX_PASOS_POR_FRAME = 5  # Máximo de ticks recuperados por frame si el juego se atrasa
+TOLERANCIA_RELOJ = 1e-9  # El reloj virtual suma pasos de 1/ticks con error de punto flotante
 
 # Colores
 BLACK = (0, 0, 0)
@@ -30,32 +50,67 @@ SILVER = (192, 192, 192)
 class JuegoCarrito:
     """Clase principal del juego de carrito con obstáculos dinámicos"""
     
-    def __init__(self):
-        # Usar pantalla existente del menú
-        self.screen = pygame.display.get_surface()
-        if self.screen is None:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("🚗 Juego de Carrito con Obstáculos Dinámicos - Árbol AVL 🌳")
+    def __init__(self, headless=False, reloj=None):
+        self.headless = headless
+        
+        if headless:
+            # Sin pantalla: dibujar (si se pide) en una superficie fuera de pantalla
+            pygame.font.init()
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            # Usar pantalla existente del menú
+            self.screen = pygame.display.get_surface()
+            if self.screen is None:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("🚗 Juego de Carrito con Obstáculos Dinámicos - Árbol AVL 🌳")
+        
+        # Reloj del juego: virtual en modo headless, reloj del sistema en modo normal
+        if reloj is None:
+            reloj = RelojVirtual() if headless else time.time
+        self.reloj = reloj
         
         # Cargar configuración
         self.cargar_configuracion()
+        configurar_bitacora(self.config['config'].get('nivel_bitacora', NIVEL_POR_DEFECTO))
+        
+        # Almacén NumPy opcional para visibilidad y colisiones vectorizadas
+        self.usar_numpy = self.config['config'].get('almacen_numpy', False)
+        if self.usar_numpy and not NUMPY_DISPONIBLE:
+            print("⚠️ almacen_numpy está activado pero numpy no está instalado: se usa el árbol")
+            self.usar_numpy = False
         
         # Inicializar componentes
         self.carrito = Carrito(self.config['config'])
-        self.arbol_obstaculos = ArbolAVL()
         self.cargar_obstaculos()
         
+        # Fondo (césped + carretera) renderizado una sola vez
+        self.fondo_carretera = self.crear_fondo_carretera()
+        
         # Variables de juego
         self.font = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
-        self.ultimo_avance = time.time()
+        self.font_mini = pygame.font.Font(None, 20)
+        self.ultimo_avance = self.reloj()
         self.juego_terminado = False
         self.victoria = False
         
         # Variables para controlar el movimiento automático
-        self.ultimo_movimiento = time.time()
+        self.ultimo_movimiento = self.reloj()
         self.intervalo_movimiento = self.config['config']['refresco_ms'] / 1000.0
         
+        # Simulación con paso fijo: cada tick avanza el reloj 1/ticks_por_segundo segundos
+        self.ticks_por_segundo = self.config['config'].get('ticks_por_segundo', TICKS_POR_SEGUNDO)
+        self.fps_render = self.config['config'].get('fps_render', FPS_RENDER)
+        self._estado_anterior = None  # (carrito, distancia, altura de salto) antes del último tick
+        self.tick = 0  # Ticks de simulación ejecutados
+        
+        # Grabación de entradas (solo mientras run() graba una partida)
+        self.grabacion = None
+        self.salir_del_programa = False
+        
+        # Perfilador de frames por fase (se activa con P)
+        self.perfilador = PerfiladorFrames()
+        
         # Variables para inserción de obstáculos
         self.modo_insercion = False
         self.datos_insercion = {'x': '', 'y': '', 'tipo': 'roca'}
@@ -66,12 +121,19 @@ class JuegoCarrito:
         # Visualizador del árbol AVL integrado en pygame
         self.visualizador = VisualizadorAVLPygame(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
         print("✅ Visualizador AVL pygame inicializado")
+        
+        # Renderizado por rectángulos sucios (opcional, no aplica sin pantalla)
+        self.regiones_sucias = None
+        if self.config['config'].get('render_rectangulos_sucios', False) and not headless:
+            self.regiones_sucias = GestorRegionesSucias(SCREEN_WIDTH, SCREEN_HEIGHT)
     
     def cargar_configuracion(self):
         """Carga la configuración desde el archivo JSON"""
         try:
             with open('config.json', 'r', encoding='utf-8') as f:
                 self.config = json.load(f)
+            # Registros compactos compartidos por el árbol, el juego y el visualizador
+            self.config['obstaculos'] = [Obstaculo.desde_dict(datos) for datos in self.config['obstaculos']]
         except FileNotFoundError:
             print("Error: No se encontró el archivo config.json")
             sys.exit(1)
@@ -81,18 +143,23 @@ class JuegoCarrito:
     
     def cargar_obstaculos(self):
         """Carga obstáculos desde la configuración al árbol AVL"""
-        print("\n=== Cargando obstáculos en el Árbol AVL ===")
-        for obstaculo_data in self.config['obstaculos']:
-            self.arbol_obstaculos.insertar(obstaculo_data)
-            print(f"Insertado: {obstaculo_data}")
-        
-        print("\n=== Estructura del Árbol AVL ===")
-        self.arbol_obstaculos.mostrar_estructura()
-        
-        print("\n=== Recorrido en orden ===")
-        obstaculos_ordenados = self.arbol_obstaculos.recorrido_inorden()
-        for obs in obstaculos_ordenados:
-            print(f"x={obs['x']}, y={obs['y']}, tipo={obs['tipo']}")
+        # Construcción en bloque: árbol balanceado sin rotaciones
+        self.arbol_obstaculos = ArbolAVL.desde_lista(self.config['obstaculos'])
+        self.ventana_visible = VentanaObstaculos(self.arbol_obstaculos)
+        self.indice_carriles = IndiceCarriles.desde_arbol(self.arbol_obstaculos, NUM_CARRILES)
+        self.almacen_numpy = None
+        if self.usar_numpy:
+            self.almacen_numpy = AlmacenObstaculosNumpy.desde_lista(self.arbol_obstaculos.recorrido_inorden())
+        log.info("🌳 Cargados en el Árbol AVL: %d obstáculos", self.arbol_obstaculos.contar_nodos())
+        
+        # Volcar el árbol completo solo al depurar: recorre todos los nodos
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("=== Estructura del Árbol AVL ===")
+            for linea in self.arbol_obstaculos.lineas_estructura():
+                log.debug("%s", linea)
+            log.debug("=== Recorrido en orden ===")
+            for obs in self.arbol_obstaculos.iter_inorden():
+                log.debug("x=%s, y=%s, tipo=%s", obs.x, obs.y, obs.tipo)
     
     def reiniciar_juego(self):
         """Reinicia el juego al estado inicial"""
@@ -100,13 +167,12 @@ class JuegoCarrito:
         self.carrito = Carrito(self.config['config'])
         
         # Reinicializar árbol de obstáculos
-        self.arbol_obstaculos = ArbolAVL()
         self.cargar_obstaculos()
         
         # Reinicializar variables de juego
         self.juego_terminado = False
         self.victoria = False
-        self.ultimo_movimiento = time.time()
+        self.ultimo_movimiento = self.reloj()
         
         print("🔄 Juego reiniciado")
     
@@ -117,48 +183,70 @@ class JuegoCarrito:
                 return False
             
             elif event.type == pygame.KEYDOWN:
-                # Si estamos en modo inserción, manejar esos eventos primero
-                if self.modo_insercion:
-                    self.manejar_entrada_insercion(event)
-                else:
-                    # Controles normales del juego
-                    if event.key == pygame.K_UP:
-                        self.carrito.mover_arriba()
-                    elif event.key == pygame.K_DOWN:
-                        self.carrito.mover_abajo()
-                    elif event.key == pygame.K_SPACE:
-                        self.carrito.saltar()
-                    elif event.key == pygame.K_ESCAPE:
-                        return False
-                    elif event.key == pygame.K_q:
+                if self.grabacion is not None:
+                    self.grabacion.registrar(self.tick, event)
+                if not self.procesar_tecla(event):
+                    if self.salir_del_programa:
                         pygame.quit()
                         sys.exit()
-                    elif event.key == pygame.K_r and self.juego_terminado:
-                        self.reiniciar_juego()
-                    elif event.key == pygame.K_v:
-                        self.mostrar_visualizacion_arbol()
-                    elif event.key == pygame.K_e:
-                        self.mostrar_estadisticas_arbol()
-                    elif event.key == pygame.K_c:
-                        self.cerrar_ventanas_matplotlib()
-                    elif event.key == pygame.K_t:
-                        self.mostrar_recorridos_arbol()
-                    elif event.key == pygame.K_i:
-                        self.alternar_modo_insercion()
+                    return False
+        
+        return True
+    
+    def procesar_tecla(self, event):
+        """Aplica una tecla presionada; devuelve False si el juego debe terminar"""
+        # Si estamos en modo inserción, manejar esos eventos primero
+        if self.modo_insercion:
+            self.manejar_entrada_insercion(event)
+        elif self.visualizador.manejar_tecla(event):
+            pass  # Pan/zoom del overlay del árbol
+        else:
+            # Controles normales del juego
+            if event.key == pygame.K_UP:
+                self.carrito.mover_arriba()
+            elif event.key == pygame.K_DOWN:
+                self.carrito.mover_abajo()
+            elif event.key == pygame.K_SPACE:
+                self.carrito.saltar()
+            elif event.key == pygame.K_ESCAPE:
+                return False
+            elif event.key == pygame.K_q:
+                self.salir_del_programa = True
+                return False
+            elif event.key == pygame.K_r and self.juego_terminado:
+                self.reiniciar_juego()
+            elif event.key == pygame.K_v:
+                self.mostrar_visualizacion_arbol()
+            elif event.key == pygame.K_e:
+                self.mostrar_estadisticas_arbol()
+            elif event.key == pygame.K_c:
+                self.cerrar_ventanas_matplotlib()
+            elif event.key == pygame.K_t:
+                self.mostrar_recorridos_arbol()
+            elif event.key == pygame.K_i:
+                self.alternar_modo_insercion()
+            elif event.key == pygame.K_p:
+                estado = self.perfilador.alternar()
+                log.info("⏱ Perfilador de frames: %s", 'ACTIVADO' if estado else 'DESACTIVADO')
+                if self.regiones_sucias is not None:
+                    self.regiones_sucias.marcar_todo()
         
         return True
     
-    def actualizar_juego(self):
-        """Actualiza la lógica del juego"""
+    def actualizar_juego(self, dt=None):
+        """Actualiza la lógica del juego para un tick de dt segundos (por defecto 1/ticks_por_segundo)"""
         if self.juego_terminado:
             return
         
-        tiempo_actual = time.time()
+        if dt is None:
+            dt = 1.0 / self.ticks_por_segundo
+        tiempo_actual = self.reloj()
         
-        # Movimiento automático del carrito
-        if tiempo_actual - self.ultimo_movimiento >= self.intervalo_movimiento:
+        # Movimiento automático del carrito: el próximo avance se programa desde el anterior
+        # (no desde el tick actual) para que el periodo sea exacto con cualquier ticks_por_segundo
+        if tiempo_actual - self.ultimo_movimiento >= self.intervalo_movimiento - TOLERANCIA_RELOJ:
             self.carrito.distancia_recorrida += self.config['config']['velocidad']
-            self.ultimo_movimiento = tiempo_actual
+            self.ultimo_movimiento += self.intervalo_movimiento
             
             # Verificar si llegó al final
             if self.carrito.distancia_recorrida >= self.config['config']['distancia_total']:
@@ -166,7 +254,7 @@ class JuegoCarrito:
                 self.juego_terminado = True
         
         # Actualizar salto
-        self.carrito.actualizar_salto()
+        self.carrito.actualizar_salto(dt)
         
         # Verificar colisiones con obstáculos visibles
         self.verificar_colisiones()
@@ -178,56 +266,101 @@ class JuegoCarrito:
         if not self.carrito.esta_vivo():
             self.juego_terminado = True
     
+    def obtener_obstaculos_visibles(self):
+        """
+        Obtiene los obstáculos visibles del frame actual (mismo rango que
+        ArbolAVL.obtener_obstaculos_visibles). La ventana deslizante solo procesa los
+        obstáculos que entran o salen, así que colisiones y dibujo comparten el resultado.
+        """
+        x_min = max(0, self.carrito.distancia_recorrida - SCREEN_WIDTH // 4)
+        x_max = self.carrito.distancia_recorrida + SCREEN_WIDTH
+        if self.almacen_numpy is not None:
+            return self.almacen_numpy.visibles(x_min, x_max)
+        return self.ventana_visible.actualizar(x_min, x_max)
+    
+    def insertar_obstaculo(self, obstaculo):
+        """Inserta un obstáculo en el árbol manteniendo la ventana visible y el índice por carril al día"""
+        version = self.arbol_obstaculos.version
+        self.arbol_obstaculos.insertar(obstaculo)
+        if self.arbol_obstaculos.version != version:
+            self.ventana_visible.agregar(obstaculo)
+            self.indice_carriles.insertar(obstaculo)
+            if self.almacen_numpy is not None:
+                self.almacen_numpy.insertar(obstaculo)
+    
+    def eliminar_obstaculo(self, obstaculo):
+        """Elimina un obstáculo del árbol manteniendo la ventana visible y el índice por carril al día"""
+        self.arbol_obstaculos.eliminar(obstaculo.x, obstaculo.y)
+        self.ventana_visible.descartar(obstaculo)
+        self.indice_carriles.eliminar(obstaculo)
+        if self.almacen_numpy is not None:
+            self.almacen_numpy.eliminar(obstaculo)
+    
     def verificar_colisiones(self):
-        """Verifica colisiones usando el árbol AVL"""
-        obstaculos_visibles = self.arbol_obstaculos.obtener_obstaculos_visibles(
-            self.carrito.distancia_recorrida, SCREEN_WIDTH)
+        """Verifica colisiones buscando en el índice por carril el obstáculo más cercano por delante"""
+        if self.almacen_numpy is not None:
+            # Búsqueda binaria del tramo que toca al carrito; el daño sale de los arreglos
+            obstaculo, dano = self.almacen_numpy.primera_colision(self.carrito, AREA_COLISION)
+        else:
+            # Solo puede chocar un obstáculo del carril del carrito con
+            # |carrito.x - (x - distancia)| < AREA_COLISION, es decir, con x mayor a este límite
+            x_desde = self.carrito.distancia_recorrida + self.carrito.x - AREA_COLISION
+            obstaculo = self.indice_carriles.primero_desde(self.carrito.y, x_desde, estricto=True)
+            dano = obstaculo.config['energia_perdida'] if obstaculo is not None else 0
+        if obstaculo is None:
+            return
         
-        for obs_data in obstaculos_visibles:
-            obstaculo = Obstaculo(obs_data['x'], obs_data['y'], obs_data['tipo'])
+        if obstaculo.colisiona_con_carrito(self.carrito):
+            self.carrito.recibir_dano(dano)
             
-            if obstaculo.colisiona_con_carrito(self.carrito):
-                dano = obstaculo.config['energia_perdida']
-                self.carrito.recibir_dano(dano)
-                
-                print(f"¡Colisión con {obs_data['tipo']}! Energía perdida: {dano}")
-                print(f"Energía restante: {self.carrito.energia}")
-                
-                # Eliminar obstáculo del árbol
-                self.arbol_obstaculos.eliminar(obs_data['x'], obs_data['y'])
-                print("💡 Presiona 'V' para ver cómo cambió el árbol AVL")
-                break
+            log.info("¡Colisión con %s! Energía perdida: %s | Energía restante: %s",
+                     obstaculo.tipo, dano, self.carrito.energia)
+            
+            # Eliminar obstáculo del árbol
+            self.eliminar_obstaculo(obstaculo)
     
     def limpiar_obstaculos_fuera_pantalla(self):
         """Elimina obstáculos que han salido de la pantalla"""
         posicion_limite = self.carrito.distancia_recorrida - 100
         
-        # Buscar obstáculos fuera de rango
-        obstaculos_a_eliminar = []
-        obstaculos_actuales = self.arbol_obstaculos.recorrido_inorden()
-        
-        for obs in obstaculos_actuales:
-            if obs['x'] < posicion_limite:
-                obstaculos_a_eliminar.append(obs)
-        
-        # Eliminar obstáculos encontrados
-        if obstaculos_a_eliminar:
-            print(f"🧹 Limpiando {len(obstaculos_a_eliminar)} obstáculos fuera de pantalla")
-            for obs in obstaculos_a_eliminar:
-                self.arbol_obstaculos.eliminar(obs['x'], obs['y'])
-                print(f"   Eliminado: x={obs['x']}, y={obs['y']}, tipo={obs['tipo']}")
-            print("💡 Presiona 'V' para ver cómo se rebalanceó el árbol automáticamente")
+        # Dividir el árbol en el límite: no cuesta nada si ningún obstáculo quedó atrás
+        obstaculos_eliminados = self.arbol_obstaculos.eliminar_menores_que(posicion_limite)
+        self.ventana_visible.descartar_lista(obstaculos_eliminados)
+        if obstaculos_eliminados:
+            self.indice_carriles.eliminar_menores_que(posicion_limite)
+            if self.almacen_numpy is not None:
+                self.almacen_numpy.eliminar_menores_que(posicion_limite)
+        
+        if obstaculos_eliminados:
+            log.info("🧹 Limpiando %d obstáculos fuera de pantalla", len(obstaculos_eliminados))
+            if log.isEnabledFor(logging.DEBUG):
+                for obs in obstaculos_eliminados:
+                    log.debug("   Eliminado: x=%s, y=%s, tipo=%s", obs.x, obs.y, obs.tipo)
     
-    def draw_carretera(self):
-        """Dibuja la carretera con líneas divisorias"""
-        # Dibujar fondo de carretera
-        pygame.draw.rect(self.screen, GRAY, (0, CARRETERA_Y, SCREEN_WIDTH, CARRETERA_HEIGHT))
+    def crear_fondo_carretera(self):
+        """
+        Renderiza el césped y la carretera con sus líneas divisorias en una superficie
+        un periodo de línea más ancha que la pantalla, para poder desplazarla al avanzar
+        """
+        ancho = SCREEN_WIDTH + PERIODO_LINEAS
+        fondo = pygame.Surface((ancho, SCREEN_HEIGHT))
+        fondo.fill(GREEN)  # Césped
+        
+        # Fondo de carretera
+        pygame.draw.rect(fondo, GRAY, (0, CARRETERA_Y, ancho, CARRETERA_HEIGHT))
         
         # Líneas divisorias entre carriles
         for i in range(1, NUM_CARRILES):
             y = CARRETERA_Y + (i * CARRETERA_HEIGHT // NUM_CARRILES)
-            for x in range(0, SCREEN_WIDTH, 40):
-                pygame.draw.line(self.screen, WHITE, (x, y), (x + 20, y), 2)
+            for x in range(0, ancho, PERIODO_LINEAS):
+                pygame.draw.line(fondo, WHITE, (x, y), (x + 20, y), 2)
+        
+        return adaptar_a_pantalla(fondo)
+    
+    def draw_carretera(self):
+        """Dibuja la carretera desplazando el fondo cacheado según la distancia recorrida"""
+        desplazamiento = int(self.carrito.distancia_recorrida) % PERIODO_LINEAS
+        self.screen.blit(self.fondo_carretera, (-desplazamiento, 0))
     
     def draw_ui(self):
         """Dibuja la interfaz de usuario"""
@@ -240,23 +373,22 @@ class JuegoCarrito:
         pygame.draw.rect(self.screen, WHITE, (10, 10, 200, 20), 2)
         
         # Texto de energía
-        energia_text = self.font_small.render(f"Energía: {self.carrito.energia}%", True, WHITE)
+        energia_text = renderizar_texto(self.font_small, f"Energía: {self.carrito.energia}%", True, WHITE)
         self.screen.blit(energia_text, (220, 12))
         
         # Distancia recorrida
-        distancia_text = self.font_small.render(
-            f"Distancia: {self.carrito.distancia_recorrida}/{self.config['config']['distancia_total']}m", 
+        distancia_text = renderizar_texto(self.font_small,
+            f"Distancia: {int(self.carrito.distancia_recorrida)}/{self.config['config']['distancia_total']}m", 
             True, WHITE)
         self.screen.blit(distancia_text, (10, 40))
         
         # Carril actual
-        carril_text = self.font_small.render(f"Carril: {self.carrito.y + 1}/6", True, WHITE)
+        carril_text = renderizar_texto(self.font_small, f"Carril: {self.carrito.y + 1}/6", True, WHITE)
         self.screen.blit(carril_text, (10, 65))
         
         # Información del árbol AVL
-        altura = self.arbol_obstaculos.altura(self.arbol_obstaculos.raiz)
-        total = self.arbol_obstaculos.contar_nodos()
-        arbol_text = self.font_small.render(f"Árbol AVL - Altura: {altura} | Nodos: {total}", True, WHITE)
+        estadisticas = self.arbol_obstaculos.obtener_estadisticas()
+        arbol_text = renderizar_texto(self.font_small, f"Árbol AVL - Altura: {estadisticas['altura']} | Nodos: {estadisticas['nodos']}", True, WHITE)
         self.screen.blit(arbol_text, (SCREEN_WIDTH - 300, 12))
         
         # Instrucciones de controles
@@ -272,17 +404,13 @@ class JuegoCarrito:
                 "ESC: Salir"
             ]
             for i, instruccion in enumerate(instrucciones):
-                text = self.font_small.render(instruccion, True, WHITE)
+                text = renderizar_texto(self.font_small, instruccion, True, WHITE)
                 self.screen.blit(text, (SCREEN_WIDTH - 170, 10 + i * 20))
     
     def draw_obstaculos(self):
-        """Dibuja los obstáculos visibles"""
-        obstaculos_visibles = self.arbol_obstaculos.obtener_obstaculos_visibles(
-            self.carrito.distancia_recorrida, SCREEN_WIDTH)
-        
-        for obs_data in obstaculos_visibles:
-            obstaculo = Obstaculo(obs_data['x'], obs_data['y'], obs_data['tipo'])
-            obstaculo.draw(self.screen, self.carrito.distancia_recorrida)
+        """Dibuja los obstáculos visibles (sprites cacheados por tipo)"""
+        obstaculos_visibles = self.obtener_obstaculos_visibles()
+        dibujar_obstaculos(self.screen, obstaculos_visibles, self.carrito.distancia_recorrida)
     
     def draw_game_over(self):
         """Dibuja la pantalla de game over"""
@@ -300,15 +428,15 @@ class JuegoCarrito:
             mensaje = "Te quedaste sin energía"
             color = RED
         
-        titulo_text = self.font.render(titulo, True, color)
+        titulo_text = renderizar_texto(self.font, titulo, True, color)
         titulo_rect = titulo_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
         self.screen.blit(titulo_text, titulo_rect)
         
-        mensaje_text = self.font_small.render(mensaje, True, WHITE)
+        mensaje_text = renderizar_texto(self.font_small, mensaje, True, WHITE)
         mensaje_rect = mensaje_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 10))
         self.screen.blit(mensaje_text, mensaje_rect)
         
-        reiniciar_text = self.font_small.render("R: Reiniciar | ESC: Menú Principal | Q: Salir", True, WHITE)
+        reiniciar_text = renderizar_texto(self.font_small, "R: Reiniciar | ESC: Menú Principal | Q: Salir", True, WHITE)
         reiniciar_rect = reiniciar_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30))
         self.screen.blit(reiniciar_text, reiniciar_rect)
     
@@ -330,7 +458,7 @@ class JuegoCarrito:
         pygame.draw.rect(self.screen, GOLD, (panel_x, panel_y, panel_width, panel_height), 3)
         
         # Título
-        titulo = self.font_small.render("🔧 INSERTAR OBSTÁCULO", True, GOLD)
+        titulo = renderizar_texto(self.font_small, "🔧 INSERTAR OBSTÁCULO", True, GOLD)
         self.screen.blit(titulo, (panel_x + 10, panel_y + 10))
         
         # Campos de entrada
@@ -349,7 +477,7 @@ class JuegoCarrito:
             color_texto = YELLOW if self.campo_activo == campo_nombre else WHITE
             
             # Etiqueta
-            etiqueta_text = self.font_small.render(f"{etiqueta}:", True, color_texto)
+            etiqueta_text = renderizar_texto(self.font_small, f"{etiqueta}:", True, color_texto)
             self.screen.blit(etiqueta_text, (panel_x + 10, y_pos))
             
             # Valor
@@ -357,7 +485,7 @@ class JuegoCarrito:
             if campo_nombre == self.campo_activo:
                 valor_mostrar += "|"  # Cursor
             
-            valor_text = self.font_small.render(valor_mostrar, True, color_texto)
+            valor_text = renderizar_texto(self.font_small, valor_mostrar, True, color_texto)
             self.screen.blit(valor_text, (panel_x + 150, y_pos))
         
         # Instrucciones
@@ -370,40 +498,101 @@ class JuegoCarrito:
         
         for i, instruccion in enumerate(instrucciones):
             y_pos = panel_y + 130 + i * 16
-            texto = pygame.font.Font(None, 20).render(instruccion, True, SILVER)
+            texto = renderizar_texto(self.font_mini, instruccion, True, SILVER)
             self.screen.blit(texto, (panel_x + 10, y_pos))
     
+    def registrar_regiones_sucias(self):
+        """Registra las regiones de pantalla del frame con la firma de lo que muestran"""
+        regiones = self.regiones_sucias
+        distancia = self.carrito.distancia_recorrida
+        arbol = self.arbol_obstaculos
+        
+        # Carretera y obstáculos: cambian al avanzar o al modificarse el árbol
+        regiones.registrar('escena', (0, CARRETERA_Y - 20, SCREEN_WIDTH, CARRETERA_HEIGHT + 40),
+                           (distancia, arbol, arbol.version))
+        
+        # Carrito: posición y sprite actual
+        regiones.registrar('carrito', self.carrito.obtener_rect(),
+                           (self.carrito.color_actual, self.carrito.saltando))
+        
+        # HUD: energía, distancia y carril a la izquierda; árbol e instrucciones a la derecha
+        regiones.registrar('hud_carrito', (0, 0, 420, 90),
+                           (self.carrito.energia, distancia, self.carrito.y))
+        regiones.registrar('hud_arbol', (SCREEN_WIDTH - 300, 0, 300, CARRETERA_Y - 20),
+                           (arbol.obtener_altura(), arbol.contar_nodos(), self.juego_terminado))
+        
+        # Pantalla de game over y overlays del visualizador: cubren toda la pantalla
+        if self.juego_terminado:
+            regiones.registrar('game_over', (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), self.victoria)
+        firma_overlays = self.visualizador.firma_estado(arbol) if self.visualizador else None
+        if firma_overlays is not None:
+            regiones.registrar('overlays', (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), firma_overlays)
+        
+        # Panel de inserción
+        if self.modo_insercion:
+            regiones.registrar('insercion', (SCREEN_WIDTH - 410, 10, 400, 200),
+                               (tuple(self.datos_insercion.values()), self.campo_activo))
+        
+        # Panel del perfilador: sus números cambian en cada frame
+        if self.perfilador.activo:
+            regiones.registrar('perfilador', (10, 100, 360, SCREEN_HEIGHT - 110), self.perfilador.frames)
+    
     def draw(self):
         """Dibuja todos los elementos del juego"""
-        self.screen.fill(GREEN)  # Césped
+        if self.regiones_sucias is not None:
+            # Si ninguna región cambió, no hace falta dibujar ni actualizar la pantalla
+            self.registrar_regiones_sucias()
+            if not self.regiones_sucias.cerrar_frame():
+                return
         
-        # Dibujar carretera
-        self.draw_carretera()
+        medir = self.perfilador.medir
+        
+        # Dibujar césped y carretera
+        with medir('draw_carretera'):
+            self.draw_carretera()
         
         # Dibujar obstáculos
-        self.draw_obstaculos()
+        with medir('draw_obstaculos'):
+            self.draw_obstaculos()
         
         # Dibujar carrito
-        self.carrito.draw(self.screen)
+        with medir('draw_carrito'):
+            self.carrito.draw(self.screen)
         
         # Dibujar UI
-        self.draw_ui()
+        with medir('draw_ui'):
+            self.draw_ui()
         
         # Dibujar game over si es necesario
         if self.juego_terminado:
-            self.draw_game_over()
+            with medir('draw_game_over'):
+                self.draw_game_over()
         
         # Dibujar visualizaciones del árbol AVL (overlays)
         if self.visualizador:
-            self.visualizador.dibujar_overlay_arbol(self.arbol_obstaculos)
-            self.visualizador.dibujar_overlay_estadisticas(self.arbol_obstaculos)  
-            self.visualizador.dibujar_overlay_recorridos(self.arbol_obstaculos)
+            with medir('overlay_arbol'):
+                self.visualizador.dibujar_overlay_arbol(self.arbol_obstaculos)
+            with medir('overlay_estadisticas'):
+                self.visualizador.dibujar_overlay_estadisticas(self.arbol_obstaculos)  
+            with medir('overlay_recorridos'):
+                self.visualizador.dibujar_overlay_recorridos(self.arbol_obstaculos)
         
         # Dibujar interfaz de inserción si está activa
         if self.modo_insercion:
-            self.dibujar_interfaz_insercion()
+            with medir('draw_insercion'):
+                self.dibujar_interfaz_insercion()
+        
+        # Panel del perfilador (muestra los tiempos de frames anteriores)
+        with medir('overlay_perfilador'):
+            self.perfilador.dibujar(self.screen, self.font_mini, 10, 100)
         
-        pygame.display.flip()
+        if self.headless:
+            return
+        with medir('presentar'):
+            if self.regiones_sucias is not None:
+                self.regiones_sucias.presentar()
+            else:
+                pygame.display.flip()
     
     # Métodos de visualización y funcionalidad AVL
     def mostrar_visualizacion_arbol(self):
@@ -458,11 +647,12 @@ class JuegoCarrito:
     
     def manejar_entrada_insercion(self, event):
         """Maneja la entrada de datos para insertar obstáculos"""
-        print(f"🔧 Tecla presionada en modo inserción: {pygame.key.name(event.key)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔧 Tecla presionada en modo inserción: %s", pygame.key.name(event.key))
         
         if event.key == pygame.K_ESCAPE:
             self.modo_insercion = False
-            print("🔧 Inserción cancelada")
+            log.info("🔧 Inserción cancelada")
             return
         
         elif event.key == pygame.K_TAB:
@@ -470,11 +660,10 @@ class JuegoCarrito:
             campos = ['x', 'y', 'tipo']
             indice_actual = campos.index(self.campo_activo)
             self.campo_activo = campos[(indice_actual + 1) % len(campos)]
-            print(f"📝 Campo activo: {self.campo_activo.upper()}")
+            log.debug("📝 Campo activo: %s", self.campo_activo.upper())
             return
         
         elif event.key == pygame.K_RETURN:
-            print("🔧 Intentando insertar obstáculo...")
             self.intentar_insertar_obstaculo()
             return
         
@@ -487,29 +676,28 @@ class JuegoCarrito:
                 else:
                     self.indice_tipo = (self.indice_tipo + 1) % len(self.tipos_disponibles)
                 self.datos_insercion['tipo'] = self.tipos_disponibles[self.indice_tipo]
-                print(f"🎯 Tipo seleccionado: {self.datos_insercion['tipo']}")
+                log.debug("🎯 Tipo seleccionado: %s", self.datos_insercion['tipo'])
         
         elif self.campo_activo in ['x', 'y']:
             if event.key == pygame.K_BACKSPACE:
                 # Borrar último carácter
                 if len(self.datos_insercion[self.campo_activo]) > 0:
                     self.datos_insercion[self.campo_activo] = self.datos_insercion[self.campo_activo][:-1]
-                    print(f"🔙 Borrado - {self.campo_activo.upper()}: '{self.datos_insercion[self.campo_activo]}'")
+                    log.debug("🔙 Borrado - %s: '%s'", self.campo_activo.upper(), self.datos_insercion[self.campo_activo])
             elif event.unicode and event.unicode.isdigit():
                 # Agregar dígito
                 self.datos_insercion[self.campo_activo] += event.unicode
-                print(f"➕ Agregado - {self.campo_activo.upper()}: '{self.datos_insercion[self.campo_activo]}'")
+                log.debug("➕ Agregado - %s: '%s'", self.campo_activo.upper(), self.datos_insercion[self.campo_activo])
             elif event.unicode:
-                print(f"❌ Carácter no válido: '{event.unicode}' - Solo números permitidos")
+                log.warning("❌ Carácter no válido: '%s' - Solo números permitidos", event.unicode)
     
     def intentar_insertar_obstaculo(self):
         """Intenta insertar el obstáculo con los datos ingresados"""
         try:
             # Verificar que tengamos datos
             if not self.datos_insercion['x'] or not self.datos_insercion['y']:
-                print("❌ Error: Debes ingresar valores para X e Y")
-                print(f"   X actual: '{self.datos_insercion['x']}'")
-                print(f"   Y actual: '{self.datos_insercion['y']}'")
+                log.warning("❌ Error: Debes ingresar valores para X e Y (X: '%s', Y: '%s')",
+                            self.datos_insercion['x'], self.datos_insercion['y'])
                 return
             
             # Validar datos
@@ -517,70 +705,238 @@ class JuegoCarrito:
             y = int(self.datos_insercion['y'])
             tipo = self.datos_insercion['tipo']
             
-            print(f"🔍 Validando: X={x}, Y={y}, Tipo={tipo}")
-            print(f"   Posición actual del carrito: {self.carrito.distancia_recorrida}")
+            log.debug("🔍 Validando: X=%s, Y=%s, Tipo=%s (posición actual del carrito: %s)",
+                      x, y, tipo, self.carrito.distancia_recorrida)
             
             # Validar rango de Y (0-5 para 6 carriles)
             if not (0 <= y <= 5):
-                print(f"❌ Error: Y debe estar entre 0 y 5 (carriles disponibles)")
-                print(f"   Valor ingresado: {y}")
+                log.warning("❌ Error: Y debe estar entre 0 y 5 (carriles disponibles). Valor ingresado: %s", y)
                 return
             
             # Validar que X sea mayor a la posición actual del carrito
             if x <= self.carrito.distancia_recorrida:
-                print(f"❌ Error: X debe ser mayor a {self.carrito.distancia_recorrida} (posición actual)")
-                print(f"   Valor ingresado: {x}")
+                log.warning("❌ Error: X debe ser mayor a %s (posición actual). Valor ingresado: %s",
+                            self.carrito.distancia_recorrida, x)
                 return
             
             # Crear obstáculo
-            nuevo_obstaculo = {
-                'x': x,
-                'y': y,
-                'tipo': tipo,
-                'id': int(time.time() * 1000)  # ID único basado en timestamp
-            }
+            nuevo_obstaculo = Obstaculo(x, y, tipo,
+                                        int(self.reloj() * 1000))  # ID único basado en timestamp
             
             # Insertar en el árbol
-            self.arbol_obstaculos.insertar(nuevo_obstaculo)
+            self.insertar_obstaculo(nuevo_obstaculo)
             
-            print(f"✅ Obstáculo insertado exitosamente:")
-            print(f"   X: {x}, Y: {y}, Tipo: {tipo}")
-            print(f"🌳 Árbol rebalanceado automáticamente")
+            log.info("✅ Obstáculo insertado: X: %s, Y: %s, Tipo: %s", x, y, tipo)
             
             # Resetear modo inserción
             self.modo_insercion = False
             self.datos_insercion = {'x': '', 'y': '', 'tipo': 'roca'}
             
         except ValueError as e:
-            print(f"❌ Error: X e Y deben ser números enteros")
-            print(f"   X: '{self.datos_insercion['x']}', Y: '{self.datos_insercion['y']}'")
+            log.warning("❌ Error: X e Y deben ser números enteros (X: '%s', Y: '%s')",
+                        self.datos_insercion['x'], self.datos_insercion['y'])
         except Exception as e:
-            print(f"❌ Error al insertar obstáculo: {e}")
+            log.error("❌ Error al insertar obstáculo: %s", e)
     
-    def run(self):
-        """Bucle principal del juego"""
+    def run(self, grabar=None, perfil=None):
+        """
+        Bucle principal del juego. Si se indica grabar, guarda las entradas en ese archivo;
+        si se indica perfil, arranca con el perfilador activo y exporta sus tiempos ahí.
+        """
         clock = pygame.time.Clock()
-        running = True
         
         print("\n=== INICIANDO JUEGO ===")
         print("Controles:")
         print("- Flechas ↑↓: Cambiar de carril")
         print("- ESPACIO: Saltar")
         print("- V: Visualizar Árbol AVL 🌳")
+        print("  (con el árbol abierto: +/- zoom, W/A/S/D mover, 0 centrar 🔍)")
         print("- E: Mostrar estadísticas 📊")
         print("- T: Ver recorridos (Inorden/Preorden/Postorden) 📋")
+        print("  (con los recorridos abiertos: RePág/AvPág cambian de página, Inicio/Fin 📄)")
         print("- I: Insertar obstáculos dinámicamente 🔧")
         print("- C: Cerrar visualizaciones")
         print("- ESC: Regresar al menú")
         print("- R: Reiniciar (cuando termine el juego)")
+        print("- P: Perfilador de frames (tiempos por fase) ⏱")
         print("\n🎮 ¡Presiona 'V' durante el juego para ver el árbol en tiempo real!")
         print("♻️  Los obstáculos se eliminan automáticamente al chocar o salir de pantalla")
         
-        while running:
-            running = self.handle_events()
-            self.actualizar_juego()
-            self.draw()
-            clock.tick(60)  # 60 FPS
+        # La simulación avanza en ticks fijos sobre un reloj virtual, sin importar a
+        # cuántos FPS se dibuje; el tiempo real solo decide cuántos ticks tocan por frame
+        if not isinstance(self.reloj, RelojVirtual):
+            self.reloj = RelojVirtual(self.reloj())
+        self.ultimo_movimiento = self.reloj()
+        if grabar:
+            self.grabacion = GrabacionEntradas(self.reloj(), self.ticks_por_segundo)
+        if perfil and not self.perfilador.activo:
+            self.perfilador.alternar()
+        dt = 1.0 / self.ticks_por_segundo
+        
+        try:
+            self._bucle_tiempo_real(clock, dt)
+        finally:
+            # Guardar también si se sale con Q (sys.exit)
+            if self.grabacion is not None:
+                self.grabacion.total_ticks = self.tick
+                self.grabacion.guardar(grabar)
+                print(f"💾 Partida grabada en {grabar} ({len(self.grabacion.eventos)} teclas, {self.tick} ticks)")
+                self.grabacion = None
+            if perfil:
+                self.perfilador.exportar(perfil)
+                print(f"⏱ Perfil de frames guardado en {perfil}")
         
         # No cerrar pygame, solo regresar al menú
-        print("🔙 Regresando al menú principal...")
\ No newline at end of file
+        print("🔙 Regresando al menú principal...")
+    
+    def _bucle_tiempo_real(self, clock, dt):
+        """Bucle de eventos, ticks fijos y dibujo hasta que el jugador sale"""
+        acumulador = 0.0
+        anterior = time.perf_counter()
+        perfilador = self.perfilador
+        
+        while True:
+            perfilador.iniciar_frame()
+            with perfilador.medir('handle_events'):
+                seguir = self.handle_events()
+            if not seguir:
+                break
+            
+            ahora = time.perf_counter()
+            acumulador += ahora - anterior
+            anterior = ahora
+            
+            pasos = 0
+            while acumulador >= dt and pasos < MAX_PASOS_POR_FRAME:
+                self.ejecutar_tick(dt)
+                acumulador -= dt
+                pasos += 1
+            if acumulador >= dt:
+                # Demasiado atraso (p. ej. al arrastrar la ventana): descartarlo en vez de acelerar
+                acumulador %= dt
+            
+            self.dibujar_interpolado(acumulador / dt)
+            perfilador.cerrar_frame()
+            clock.tick(self.fps_render)
+    
+    def ejecutar_tick(self, dt):
+        """Avanza la simulación un paso fijo de dt segundos en el reloj virtual"""
+        carrito = self.carrito
+        self._estado_anterior = (carrito, carrito.distancia_recorrida, carrito.altura_salto)
+        with self.perfilador.medir('actualizar_juego'):
+            self.actualizar_juego(dt)
+        self.reloj.avanzar(dt)
+        self.tick += 1
+    
+    def dibujar_interpolado(self, alfa):
+        """
+        Dibuja el frame con la distancia y la altura de salto interpoladas entre los dos
+        últimos ticks (alfa = fracción de tick transcurrida desde el último)
+        """
+        carrito = self.carrito
+        if self._estado_anterior is None or self._estado_anterior[0] is not carrito:
+            self.draw()  # Todavía no hay tick previo (o el juego se reinició)
+            return
+        
+        _, distancia_previa, altura_previa = self._estado_anterior
+        distancia = carrito.distancia_recorrida
+        altura_salto = carrito.altura_salto
+        carrito.distancia_recorrida = distancia_previa + (distancia - distancia_previa) * alfa
+        carrito.altura_salto = altura_previa + (altura_salto - altura_previa) * alfa
+        try:
+            self.draw()
+        finally:
+            carrito.distancia_recorrida = distancia
+            carrito.altura_salto = altura_salto
+    
+    def simular(self, vueltas=1, max_frames=None, dibujar=False):
+        """
+        Ejecuta el juego sin pantalla usando el reloj virtual.
+        Cada frame es un tick de 1/ticks_por_segundo segundos (el mismo paso que
+        run() y reproducir()) sin esperar al reloj real. Devuelve un resumen con los resultados de cada vuelta.
+        """
+        if not isinstance(self.reloj, RelojVirtual):
+            raise RuntimeError("simular() requiere un JuegoCarrito creado con headless=True")
+        
+        paso = 1.0 / self.ticks_por_segundo
+        frames = 0
+        resultados = []
+        
+        while len(resultados) < vueltas:
+            if max_frames is not None and frames >= max_frames:
+                break
+            
+            self.perfilador.iniciar_frame()
+            self.ejecutar_tick(paso)
+            if dibujar:
+                self.draw()
+            self.perfilador.cerrar_frame()
+            frames += 1
+            
+            if self.juego_terminado:
+                resultados.append({
+                    'victoria': self.victoria,
+                    'energia': self.carrito.energia,
+                    'distancia': self.carrito.distancia_recorrida,
+                    'obstaculos_restantes': self.arbol_obstaculos.contar_nodos()
+                })
+                if len(resultados) < vueltas:
+                    self.reiniciar_juego()
+        
+        return {
+            'frames': frames,
+            'tiempo_simulado': frames * paso,
+            'vueltas': resultados,
+            'arbol': self.arbol_obstaculos.obtener_estadisticas()
+        }
+    
+    def reproducir(self, grabacion, dibujar=False, tiempo_real=False):
+        """
+        Reproduce una partida grabada aplicando cada tecla en su tick.
+        Sin dibujar ni tiempo real avanza lo más rápido posible (para perfilar o
+        reproducir errores); con tiempo_real se respeta la velocidad original.
+        Devuelve un resumen del estado final.
+        """
+        self.reloj = RelojVirtual(grabacion.reloj_inicial)
+        self.ultimo_movimiento = self.reloj()
+        self.ticks_por_segundo = grabacion.ticks_por_segundo
+        dt = 1.0 / self.ticks_por_segundo
+        clock = pygame.time.Clock() if tiempo_real else None
+        
+        eventos = grabacion.eventos
+        aplicados = 0
+        terminado = False
+        while not terminado and self.tick < grabacion.total_ticks:
+            # Teclas que el jugador presionó antes de este tick
+            while aplicados < len(eventos) and eventos[aplicados][0] <= self.tick:
+                _, tecla, caracter = eventos[aplicados]
+                aplicados += 1
+                evento = pygame.event.Event(pygame.KEYDOWN, key=tecla,
+                                            unicode=chr(caracter) if caracter else '')
+                if not self.procesar_tecla(evento):
+                    terminado = True
+                    break
+            if terminado:
+                break
+            
+            self.perfilador.iniciar_frame()
+            self.ejecutar_tick(dt)
+            if dibujar:
+                self.draw()
+            self.perfilador.cerrar_frame()
+            if tiempo_real:
+                if pygame.event.peek(pygame.QUIT):
+                    break
+                clock.tick(self.ticks_por_segundo)
+        
+        return {
+            'ticks': self.tick,
+            'teclas': aplicados,
+            'tiempo_simulado': self.tick * dt,
+            'juego_terminado': self.juego_terminado,
+            'victoria': self.victoria,
+            'energia': self.carrito.energia,
+            'distancia': self.carrito.distancia_recorrida,
+            'obstaculos_restantes': self.arbol_obstaculos.contar_nodos(),
+            'arbol': self.arbol_obstaculos.obtener_estadisticas()
+        }
@@ -1,6 +1,7 @@
 import pygame
 import math
 import sys
+from cache_texto import renderizar_texto
 
 # Colores para el menú
 BLACK = (0, 0, 0)
@@ -107,17 +108,17 @@ class MenuPrincipal:
         self.pulso_titulo = math.sin(self.tiempo * 0.05) * 10
         
         # Sombra del título
-        titulo_shadow = self.font_title.render("CARRITO AVL", True, BLACK)
+        titulo_shadow = renderizar_texto(self.font_title, "CARRITO AVL", True, BLACK)
         shadow_rect = titulo_shadow.get_rect(center=(self.SCREEN_WIDTH//2 + 3, 120 + 3))
         self.screen.blit(titulo_shadow, shadow_rect)
         
         # Título principal con efecto de pulso
-        titulo = self.font_title.render("CARRITO AVL", True, GOLD)
+        titulo = renderizar_texto(self.font_title, "CARRITO AVL", True, GOLD)
         titulo_rect = titulo.get_rect(center=(self.SCREEN_WIDTH//2, 120 + self.pulso_titulo))
         self.screen.blit(titulo, titulo_rect)
         
         # Subtítulo
-        subtitulo = self.font_subtitle.render("Obstáculos Dinámicos con Árbol AVL", True, SILVER)
+        subtitulo = renderizar_texto(self.font_subtitle, "Obstáculos Dinámicos con Árbol AVL", True, SILVER)
         subtitulo_rect = subtitulo.get_rect(center=(self.SCREEN_WIDTH//2, 160))
         self.screen.blit(subtitulo, subtitulo_rect)
     
@@ -138,7 +139,7 @@ class MenuPrincipal:
         pygame.draw.rect(self.screen, WHITE, rect, 3)
         
         # Texto del botón
-        texto_render = self.font_button.render(texto, True, color_texto)
+        texto_render = renderizar_texto(self.font_button, texto, True, color_texto)
         texto_rect = texto_render.get_rect(center=rect.center)
         self.screen.blit(texto_render, texto_rect)
     
@@ -156,7 +157,7 @@ class MenuPrincipal:
         pygame.draw.rect(self.screen, GOLD, panel_rect, 4)
         
         # Título de instrucciones
-        titulo = self.font_subtitle.render("INSTRUCTIONS", True, GOLD)
+        titulo = renderizar_texto(self.font_subtitle, "INSTRUCTIONS", True, GOLD)
         titulo_rect = titulo.get_rect(center=(self.SCREEN_WIDTH//2, 120))
         self.screen.blit(titulo, titulo_rect)
         
@@ -197,7 +198,7 @@ class MenuPrincipal:
                 color = WHITE
                 font = self.font_small
             
-            texto = font.render(linea, True, color)
+            texto = renderizar_texto(font, linea, True, color)
             self.screen.blit(texto, (120, y_start + i * 22))
     
     def ejecutar(self):
@@ -220,7 +221,7 @@ class MenuPrincipal:
                 self.dibujar_boton('salir', self.botones['salir'], "EXIT")
                 
                 # Texto informativo
-                info = self.font_small.render("Use mouse or ENTER/I/ESC keys", True, SILVER)
+                info = renderizar_texto(self.font_small, "Use mouse or ENTER/I/ESC keys", True, SILVER)
                 info_rect = info.get_rect(center=(self.SCREEN_WIDTH//2, self.SCREEN_HEIGHT - 30))
                 self.screen.blit(info, info_rect)
             else:
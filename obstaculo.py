@@ -1,4 +1,7 @@
+import math
 import pygame
+from registro_obstaculo import RegistroObstaculo
+from graficos import adaptar_a_pantalla
 
 # Colores
 BLACK = (0, 0, 0)
@@ -6,6 +9,7 @@ WHITE = (255, 255, 255)
 BROWN = (139, 69, 19)
 ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
+GRAY = (128, 128, 128)
 
 # Tipos de obstáculos y sus efectos en energía
 OBSTACULO_CONFIG = {
@@ -15,18 +19,31 @@ OBSTACULO_CONFIG = {
     'aceite': {'color': PURPLE, 'energia_perdida': 15}
 }
 
-class Obstaculo:
-    """Clase que representa un obstáculo"""
-    def __init__(self, x, y, tipo, num_carriles=6, carretera_y=200, carretera_height=200):
-        self.x = x
-        self.y = y
-        self.tipo = tipo
-        self.config = OBSTACULO_CONFIG[tipo]
-        self.size = 30
-        self.area_colision = 40
-        self.num_carriles = num_carriles
-        self.carretera_y = carretera_y
-        self.carretera_height = carretera_height
+# Distancia en X (en píxeles) a partir de la cual un obstáculo ya no choca con el carrito
+AREA_COLISION = 40
+
+# Sprites pre-renderizados por tipo de obstáculo (se crean al dibujar cada tipo por primera vez)
+_SPRITES = {}
+MARGEN_SPRITE = 5  # Espacio alrededor del obstáculo para bordes y detalles
+
+class Obstaculo(RegistroObstaculo):
+    """
+    Clase que representa un obstáculo.
+    Es el mismo registro compacto que guarda el Árbol AVL: la geometría es común a
+    todos los obstáculos (atributos de clase) y la configuración se busca por tipo.
+    """
+    __slots__ = ()
+    
+    size = 30
+    area_colision = AREA_COLISION
+    num_carriles = 6
+    carretera_y = 200
+    carretera_height = 200
+    
+    @property
+    def config(self):
+        """Configuración (color y energía perdida) del tipo de obstáculo"""
+        return OBSTACULO_CONFIG[self.tipo]
     
     def get_screen_position(self, carrito_x):
         """Convierte coordenadas del mundo a pantalla"""
@@ -120,7 +137,6 @@ class Obstaculo:
         
         # Borde irregular para simular asfalto roto
         for i in range(0, 360, 30):
-            import math
             offset_x = int(math.cos(math.radians(i)) * (self.size//2 - 2))
             offset_y = int(math.sin(math.radians(i)) * 6)
             pygame.draw.circle(screen, color_borde, 
@@ -157,21 +173,48 @@ class Obstaculo:
         pygame.draw.ellipse(screen, (150, 150, 150), 
                            (x - self.size//2, y - 8, self.size, 16), 1)
     
-    def draw(self, screen, carrito_x):
-        """Dibuja el obstáculo en pantalla con diseño programático"""
-        screen_x, screen_y = self.get_screen_position(carrito_x)
-        
+    def dibujar_programatico(self, screen, x, y):
+        """Dibuja el obstáculo con primitivas, centrado en (x, y)"""
         # Dibujar cada tipo de obstáculo con su diseño específico
         if self.tipo == 'roca':
-            self.dibujar_roca(screen, screen_x, screen_y)
+            self.dibujar_roca(screen, x, y)
         elif self.tipo == 'cono':
-            self.dibujar_cono(screen, screen_x, screen_y)
+            self.dibujar_cono(screen, x, y)
         elif self.tipo == 'hueco':
-            self.dibujar_hueco(screen, screen_x, screen_y)
+            self.dibujar_hueco(screen, x, y)
         elif self.tipo == 'aceite':
-            self.dibujar_aceite(screen, screen_x, screen_y)
+            self.dibujar_aceite(screen, x, y)
         else:
-            # Fallback: dibujar rectángulo simple
-            pygame.draw.rect(screen, self.config['color'], 
-                           (screen_x - self.size//2, screen_y - self.size//2, 
-                            self.size, self.size))
\ No newline at end of file
+            # Fallback: rectángulo simple con el color configurado para el tipo (gris si no existe)
+            color = OBSTACULO_CONFIG.get(self.tipo, {}).get('color', GRAY)
+            pygame.draw.rect(screen, color, 
+                           (x - self.size//2, y - self.size//2, 
+                            self.size, self.size))
+    
+    @classmethod
+    def obtener_sprite(cls, tipo):
+        """Obtiene el sprite del tipo, renderizándolo una sola vez a una Surface convertida"""
+        sprite = _SPRITES.get(tipo)
+        if sprite is None:
+            lado = cls.size + 2 * MARGEN_SPRITE
+            sprite = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            cls(0, 0, tipo).dibujar_programatico(sprite, lado // 2, lado // 2)
+            sprite = adaptar_a_pantalla(sprite, alpha=True)
+            _SPRITES[tipo] = sprite
+        return sprite
+    
+    def draw(self, screen, carrito_x):
+        """Dibuja el obstáculo en pantalla usando el sprite cacheado de su tipo"""
+        screen_x, screen_y = self.get_screen_position(carrito_x)
+        centro = self.size // 2 + MARGEN_SPRITE
+        screen.blit(self.obtener_sprite(self.tipo), (screen_x - centro, screen_y - centro))
+
+def dibujar_obstaculos(screen, obstaculos, carrito_x):
+    """Dibuja varios obstáculos con una sola llamada a Surface.blits"""
+    centro = Obstaculo.size // 2 + MARGEN_SPRITE
+    operaciones = []
+    for obstaculo in obstaculos:
+        screen_x, screen_y = obstaculo.get_screen_position(carrito_x)
+        operaciones.append((Obstaculo.obtener_sprite(obstaculo.tipo),
+                            (screen_x - centro, screen_y - centro)))
+    screen.blits(operaciones, doreturn=False)
\ No newline at end of file
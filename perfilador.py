@@ -0,0 +1,187 @@
+"""
+Perfilador de frames por fase
+Mide cuánto tarda cada fase del frame (eventos, simulación, cada draw_* y cada overlay)
+y mantiene percentiles móviles (p50, p95, p99) de los últimos frames, un histograma del
+tiempo total de frame y una exportación a JSON para comparar entre versiones.
+Desactivado, medir() devuelve un contexto vacío compartido y no mide nada.
+"""
+
+import json
+import math
+import time
+from collections import deque
+from contextlib import nullcontext
+import pygame
+from cache_texto import renderizar_texto
+
+VENTANA_FRAMES = 240          # Frames usados para los percentiles móviles
+ANCHO_CUBETA_MS = 2.0         # Ancho de cada barra del histograma de frames
+NUM_CUBETAS = 16              # La última cubeta acumula los frames más lentos
+PRESUPUESTO_MS = 1000.0 / 60  # Tiempo de un frame a 60 FPS
+
+_SIN_MEDICION = nullcontext()
+
+class _Medicion:
+    """Contexto que suma el tiempo transcurrido a una fase del frame actual"""
+    __slots__ = ('perfilador', 'fase', 'inicio')
+
+    def __init__(self, perfilador, fase):
+        self.perfilador = perfilador
+        self.fase = fase
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        frame = self.perfilador._frame_actual
+        frame[self.fase] = frame.get(self.fase, 0.0) + (time.perf_counter() - self.inicio)
+        return False
+
+def percentil(ordenados, p):
+    """Percentil p (0-100) de una lista ya ordenada, por rango más cercano"""
+    if not ordenados:
+        return 0.0
+    indice = max(0, min(len(ordenados) - 1, math.ceil(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+class PerfiladorFrames:
+    """Tiempos por fase de los últimos frames (en milisegundos)"""
+    def __init__(self, activo=False, ventana=VENTANA_FRAMES):
+        self.activo = activo
+        self.ventana = ventana
+        self.frames = 0
+        self._muestras = {}      # fase -> deque con el tiempo de esa fase en cada frame
+        self._frame_actual = {}  # fase -> segundos acumulados en el frame en curso
+        self._inicio_frame = None
+
+    def alternar(self):
+        """Activa o desactiva el perfilador (al activarlo empieza con muestras nuevas)"""
+        self.activo = not self.activo
+        if self.activo:
+            self.reiniciar()
+        return self.activo
+
+    def reiniciar(self):
+        """Descarta todas las muestras"""
+        self.frames = 0
+        self._muestras = {}
+        self._frame_actual = {}
+        self._inicio_frame = None
+
+    def medir(self, fase):
+        """Contexto que mide una fase: with perfilador.medir('draw_ui'): ..."""
+        if not self.activo:
+            return _SIN_MEDICION
+        return _Medicion(self, fase)
+
+    def iniciar_frame(self):
+        """Marca el inicio del trabajo de un frame (después de esperar al reloj)"""
+        if self.activo:
+            self._inicio_frame = time.perf_counter()
+
+    def cerrar_frame(self):
+        """Guarda los tiempos del frame en curso como una muestra más"""
+        if not self.activo:
+            return
+        if self._inicio_frame is not None:
+            self._frame_actual['frame'] = time.perf_counter() - self._inicio_frame
+        for fase, segundos in self._frame_actual.items():
+            muestras = self._muestras.get(fase)
+            if muestras is None:
+                muestras = self._muestras[fase] = deque(maxlen=self.ventana)
+            muestras.append(segundos * 1000.0)
+        self._frame_actual = {}
+        self._inicio_frame = None
+        self.frames += 1
+
+    def estadisticas(self):
+        """Percentiles por fase: {fase: {'p50', 'p95', 'p99', 'media', 'max', 'muestras'}}"""
+        resultado = {}
+        for fase, muestras in self._muestras.items():
+            ordenados = sorted(muestras)
+            resultado[fase] = {
+                'p50': percentil(ordenados, 50),
+                'p95': percentil(ordenados, 95),
+                'p99': percentil(ordenados, 99),
+                'media': sum(ordenados) / len(ordenados),
+                'max': ordenados[-1],
+                'muestras': len(ordenados),
+            }
+        return resultado
+
+    def histograma(self):
+        """Cantidad de frames por cubeta de ANCHO_CUBETA_MS (la última incluye los más lentos)"""
+        cubetas = [0] * NUM_CUBETAS
+        for ms in self._muestras.get('frame', ()):
+            cubetas[min(NUM_CUBETAS - 1, int(ms / ANCHO_CUBETA_MS))] += 1
+        return cubetas
+
+    def exportar(self, ruta):
+        """Guarda percentiles e histograma en un archivo JSON"""
+        datos = {
+            'frames': self.frames,
+            'ventana': self.ventana,
+            'fases': self.estadisticas(),
+            'histograma_frame': {
+                'ancho_cubeta_ms': ANCHO_CUBETA_MS,
+                'cubetas': self.histograma(),
+            },
+        }
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, indent=2)
+
+    def dibujar(self, pantalla, fuente, x, y):
+        """Dibuja la tabla de percentiles por fase y el histograma de tiempos de frame"""
+        if not self.activo:
+            return
+
+        estadisticas = self.estadisticas()
+        # Fases ordenadas de la más lenta a la más rápida (p95), el frame completo arriba
+        fases = sorted((fase for fase in estadisticas if fase != 'frame'),
+                       key=lambda fase: -estadisticas[fase]['p95'])
+        if 'frame' in estadisticas:
+            fases.insert(0, 'frame')
+
+        alto_fila = 16
+        alto_histograma = 50
+        ancho = 360
+        alto = 30 + alto_fila * (len(fases) + 1) + alto_histograma
+        panel = pygame.Surface((ancho, alto))
+        panel.set_alpha(220)
+        panel.fill((15, 15, 25))
+        pygame.draw.rect(panel, (100, 150, 255), panel.get_rect(), 1)
+
+        titulo = renderizar_texto(fuente, f"⏱ Perfilador (P) - últimos {self.ventana} frames (ms)", True, (255, 255, 255))
+        panel.blit(titulo, (8, 6))
+
+        fila_y = 26
+        encabezado = renderizar_texto(fuente, "fase", True, (180, 180, 180))
+        panel.blit(encabezado, (8, fila_y))
+        for columna, nombre in enumerate(('p50', 'p95', 'p99')):
+            texto = renderizar_texto(fuente, nombre, True, (180, 180, 180))
+            panel.blit(texto, (190 + columna * 55, fila_y))
+
+        for fase in fases:
+            fila_y += alto_fila
+            datos = estadisticas[fase]
+            color = (255, 120, 120) if fase == 'frame' and datos['p95'] > PRESUPUESTO_MS else (230, 230, 230)
+            panel.blit(renderizar_texto(fuente, fase, True, color), (8, fila_y))
+            for columna, nombre in enumerate(('p50', 'p95', 'p99')):
+                texto = renderizar_texto(fuente, f"{datos[nombre]:.2f}", True, color)
+                panel.blit(texto, (190 + columna * 55, fila_y))
+
+        # Histograma del tiempo de frame; la línea marca el presupuesto de 60 FPS
+        cubetas = self.histograma()
+        base_y = alto - 6
+        ancho_barra = (ancho - 16) // NUM_CUBETAS
+        maximo = max(cubetas) or 1
+        for i, cantidad in enumerate(cubetas):
+            altura = int((alto_histograma - 10) * cantidad / maximo)
+            lenta = (i + 1) * ANCHO_CUBETA_MS > PRESUPUESTO_MS
+            pygame.draw.rect(panel, (255, 120, 120) if lenta else (120, 200, 120),
+                             (8 + i * ancho_barra, base_y - altura, ancho_barra - 2, altura))
+        limite_x = 8 + int(PRESUPUESTO_MS / ANCHO_CUBETA_MS * ancho_barra)
+        pygame.draw.line(panel, (255, 255, 0), (limite_x, base_y - alto_histograma + 6), (limite_x, base_y), 1)
+
+        pantalla.blit(panel, (x, y))
@@ -0,0 +1,61 @@
+"""
+Renderizado por rectángulos sucios
+Cada frame el juego registra sus regiones de pantalla con una "firma" del contenido
+(posición, valores mostrados, estado). Solo las regiones cuya firma cambió se envían a
+la pantalla con pygame.display.update(rects), y si nada cambió el frame no se dibuja.
+"""
+
+import pygame
+
+# Si las regiones sucias cubren más de esta fracción de la pantalla, se usa flip()
+FRACCION_PANTALLA_COMPLETA = 0.6
+
+class GestorRegionesSucias:
+    """Detecta qué regiones cambiaron entre frames y actualiza solo esas"""
+    def __init__(self, ancho, alto):
+        self.pantalla = pygame.Rect(0, 0, ancho, alto)
+        self._anteriores = {}  # nombre -> (rect, firma) del frame anterior
+        self._actuales = {}
+        self._sucios = []
+        self._todo = True      # El primer frame siempre se dibuja completo
+
+    def marcar_todo(self):
+        """Fuerza a redibujar y actualizar la pantalla completa en el próximo frame"""
+        self._todo = True
+
+    def registrar(self, nombre, rect, firma):
+        """Registra una región del frame actual con la firma de su contenido"""
+        rect = pygame.Rect(rect)
+        self._actuales[nombre] = (rect, firma)
+
+        anterior = self._anteriores.get(nombre)
+        if anterior is None:
+            self._sucios.append(rect)
+        elif anterior[0] != rect:
+            # Borrar la posición vieja y pintar la nueva
+            self._sucios.append(anterior[0])
+            self._sucios.append(rect)
+        elif anterior[1] != firma:
+            self._sucios.append(rect)
+
+    def cerrar_frame(self):
+        """Termina el registro del frame; devuelve True si hay algo que redibujar"""
+        for nombre, (rect, _) in self._anteriores.items():
+            if nombre not in self._actuales:
+                self._sucios.append(rect)  # La región desapareció
+
+        self._anteriores = self._actuales
+        self._actuales = {}
+        return self._todo or bool(self._sucios)
+
+    def presentar(self):
+        """Envía a la pantalla solo las regiones sucias (o todo si conviene)"""
+        area_sucia = sum(rect.width * rect.height for rect in self._sucios)
+        area_pantalla = self.pantalla.width * self.pantalla.height
+        if self._todo or area_sucia > area_pantalla * FRACCION_PANTALLA_COMPLETA:
+            pygame.display.flip()
+        elif self._sucios:
+            pygame.display.update([rect.clip(self.pantalla) for rect in self._sucios])
+
+        self._sucios = []
+        self._todo = False
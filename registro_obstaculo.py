@@ -0,0 +1,51 @@
+"""
+Registro compacto de obstáculos
+Tipo de dato compartido por el Árbol AVL, el juego y el visualizador: usa __slots__
+(sin diccionario por instancia) y guarda el tipo como un código entero pequeño.
+"""
+
+import sys
+
+# Tipos de obstáculo conocidos: el código de cada tipo es su posición en la lista
+TIPOS_OBSTACULO = ['roca', 'cono', 'hueco', 'aceite']
+_CODIGOS_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS_OBSTACULO)}
+
+def codigo_tipo(tipo):
+    """Obtiene el código entero de un tipo de obstáculo (los tipos nuevos se registran al vuelo)"""
+    codigo = _CODIGOS_TIPO.get(tipo)
+    if codigo is None:
+        codigo = len(TIPOS_OBSTACULO)
+        tipo = sys.intern(tipo)
+        TIPOS_OBSTACULO.append(tipo)
+        _CODIGOS_TIPO[tipo] = codigo
+    return codigo
+
+class RegistroObstaculo:
+    """Obstáculo en coordenadas del mundo: x (distancia), y (carril), tipo e id opcional"""
+    __slots__ = ('x', 'y', 'codigo', 'id')
+
+    def __init__(self, x, y, tipo, id_obstaculo=None):
+        self.x = x
+        self.y = y
+        self.codigo = codigo_tipo(tipo)
+        self.id = id_obstaculo
+
+    @property
+    def tipo(self):
+        """Nombre del tipo de obstáculo"""
+        return TIPOS_OBSTACULO[self.codigo]
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """Crea el registro a partir de un diccionario como los de config.json"""
+        return cls(datos['x'], datos['y'], datos['tipo'], datos.get('id'))
+
+    def a_dict(self):
+        """Convierte el registro a diccionario (para mostrarlo o exportarlo)"""
+        datos = {'x': self.x, 'y': self.y, 'tipo': self.tipo}
+        if self.id is not None:
+            datos['id'] = self.id
+        return datos
+
+    def __repr__(self):
+        return f"{type(self).__name__}(x={self.x}, y={self.y}, tipo={self.tipo!r})"
@@ -0,0 +1,18 @@
+"""
+Reloj virtual para simulaciones sin pantalla
+Permite avanzar el tiempo del juego manualmente en lugar de usar el reloj del sistema
+"""
+
+class RelojVirtual:
+    """Reloj que solo avanza cuando se le indica (compatible con time.time)"""
+    def __init__(self, inicio=0.0):
+        self.tiempo = inicio
+
+    def __call__(self):
+        """Devuelve el tiempo actual en segundos, igual que time.time()"""
+        return self.tiempo
+
+    def avanzar(self, segundos):
+        """Avanza el reloj la cantidad de segundos indicada"""
+        self.tiempo += segundos
+        return self.tiempo
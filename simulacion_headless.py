@@ -0,0 +1,109 @@
+"""
+🧪 Simulación sin pantalla del Juego de Carrito
+
+Ejecuta el bucle del juego con un reloj virtual, sin ventana y sin límite de FPS.
+Pensado para pruebas de resistencia y de regresión en máquinas sin display.
+
+Uso:
+    python simulacion_headless.py --vueltas 1000
+    python simulacion_headless.py --vueltas 10 --dibujar --verbose
+    python simulacion_headless.py --reproducir partida.grab
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+# Sin display: pygame no debe intentar abrir una ventana
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from juego import JuegoCarrito
+from grabacion import GrabacionEntradas
+
+def main():
+    """Ejecuta la simulación y muestra un resumen de las vueltas"""
+    parser = argparse.ArgumentParser(description="Simulación headless del juego de carrito")
+    parser.add_argument('--vueltas', type=int, default=1, help="Número de partidas a simular")
+    parser.add_argument('--max-frames', type=int, default=None, help="Límite de frames simulados")
+    parser.add_argument('--dibujar', action='store_true', help="Dibujar cada frame en una superficie fuera de pantalla")
+    parser.add_argument('--verbose', action='store_true', help="Mostrar los mensajes del juego")
+    parser.add_argument('--salida', default=None, help="Guardar el resumen en un archivo JSON")
+    parser.add_argument('--reproducir', default=None,
+                        help="Reproducir una partida grabada con game.py --grabar (sin límite de velocidad)")
+    parser.add_argument('--perfil', default=None,
+                        help="Medir el tiempo de cada fase del frame y guardarlo en este archivo JSON")
+    args = parser.parse_args()
+
+    pygame.font.init()
+    if args.verbose:
+        os.environ.setdefault('CARRITO_BITACORA', 'INFO')  # Mostrar también colisiones y limpiezas
+
+    if args.reproducir:
+        reproducir(args)
+        return
+
+    salida_juego = sys.stdout if args.verbose else open(os.devnull, 'w')
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(salida_juego):
+        juego = JuegoCarrito(headless=True)
+        if args.perfil:
+            juego.perfilador.alternar()
+        resumen = juego.simular(vueltas=args.vueltas, max_frames=args.max_frames,
+                                dibujar=args.dibujar)
+    duracion = time.perf_counter() - inicio
+    resumen['tiempo_real'] = duracion
+
+    victorias = sum(1 for vuelta in resumen['vueltas'] if vuelta['victoria'])
+    print(f"🏁 Vueltas simuladas: {len(resumen['vueltas'])} ({victorias} victorias)")
+    print(f"🎞️  Frames: {resumen['frames']} | Tiempo simulado: {resumen['tiempo_simulado']:.1f}s")
+    print(f"⏱️  Tiempo real: {duracion:.2f}s ({resumen['frames'] / max(duracion, 1e-9):.0f} frames/s)")
+    arbol = resumen['arbol']
+    print(f"🌳 Árbol: {arbol['nodos']} nodos | {arbol['inserciones']} inserciones | "
+          f"{arbol['eliminaciones']} eliminaciones | "
+          f"{sum(arbol['rotaciones'].values())} rotaciones")
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(resumen, f, indent=2)
+        print(f"💾 Resumen guardado en {args.salida}")
+    guardar_perfil(juego, args)
+
+def reproducir(args):
+    """Reproduce una partida grabada lo más rápido posible y muestra su estado final"""
+    grabacion = GrabacionEntradas.cargar(args.reproducir)
+
+    salida_juego = sys.stdout if args.verbose else open(os.devnull, 'w')
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(salida_juego):
+        juego = JuegoCarrito(headless=True)
+        if args.perfil:
+            juego.perfilador.alternar()
+        resumen = juego.reproducir(grabacion, dibujar=args.dibujar)
+    duracion = time.perf_counter() - inicio
+    resumen['tiempo_real'] = duracion
+
+    print(f"▶️  Reproducción: {resumen['ticks']} ticks ({resumen['tiempo_simulado']:.1f}s de juego), "
+          f"{resumen['teclas']} teclas")
+    print(f"🏁 Estado final: distancia {resumen['distancia']}, energía {resumen['energia']}%, "
+          f"{'victoria' if resumen['victoria'] else 'terminado' if resumen['juego_terminado'] else 'en curso'}")
+    print(f"⏱️  Tiempo real: {duracion:.2f}s")
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(resumen, f, indent=2)
+        print(f"💾 Resumen guardado en {args.salida}")
+    guardar_perfil(juego, args)
+
+def guardar_perfil(juego, args):
+    """Exporta los tiempos del perfilador si se pidió --perfil"""
+    if args.perfil:
+        juego.perfilador.exportar(args.perfil)
+        print(f"⏱ Perfil de frames guardado en {args.perfil}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Ventana deslizante de obstáculos visibles sobre el Árbol AVL
+Como el carrito solo avanza, la ventana visible se desplaza siempre hacia la derecha:
+en lugar de repetir la búsqueda en rango desde la raíz en cada frame, se agregan los
+obstáculos que entran por el borde derecho y se descartan los que salen por el izquierdo.
+"""
+
+from collections import deque
+
+class VentanaObstaculos:
+    """Cursor incremental sobre los obstáculos con x_min <= x <= x_max, en orden (x, y)"""
+    def __init__(self, arbol):
+        self.arbol = arbol
+        self.obstaculos = deque()
+        self.x_min = None
+        self.x_max = None
+        self._cursor = None       # Iterador en orden a partir del borde derecho
+        self._siguiente = None    # Primer obstáculo fuera de la ventana por la derecha
+        self._version = None      # Versión del árbol con la que la ventana está sincronizada
+
+    def actualizar(self, x_min, x_max):
+        """
+        Desplaza la ventana a [x_min, x_max] y devuelve los obstáculos visibles.
+        El costo es proporcional a los obstáculos que entran o salen; si la ventana
+        retrocede o el árbol cambió sin avisar, se reconstruye desde el árbol.
+        """
+        if (self._version != self.arbol.version or self.x_min is None
+                or x_min < self.x_min or x_max < self.x_max):
+            self._reconstruir(x_min, x_max)
+            return self.obstaculos
+
+        # Salen por el borde izquierdo
+        visibles = self.obstaculos
+        while visibles and visibles[0].x < x_min:
+            visibles.popleft()
+        self.x_min = x_min
+
+        # Entran por el borde derecho
+        if x_max != self.x_max:
+            self.x_max = x_max
+            self._avanzar_borde_derecho()
+
+        return visibles
+
+    def agregar(self, obstaculo):
+        """Avisa que el obstáculo se acaba de insertar en el árbol"""
+        if not self._preparar_cambio():
+            return
+
+        if self.x_min <= obstaculo.x <= self.x_max:
+            # Insertar manteniendo el orden (x, y); la ventana es pequeña
+            clave = (obstaculo.x, obstaculo.y)
+            indice = len(self.obstaculos)
+            while indice > 0 and (self.obstaculos[indice - 1].x, self.obstaculos[indice - 1].y) > clave:
+                indice -= 1
+            self.obstaculos.insert(indice, obstaculo)
+
+        self._terminar_cambio()
+
+    def descartar(self, obstaculo):
+        """Avisa que el obstáculo se acaba de eliminar del árbol"""
+        if not self._preparar_cambio():
+            return
+
+        for indice, visible in enumerate(self.obstaculos):
+            if visible is obstaculo:
+                del self.obstaculos[indice]
+                break
+
+        self._terminar_cambio()
+
+    def descartar_lista(self, obstaculos):
+        """Avisa que varios obstáculos se eliminaron del árbol en una sola operación"""
+        if not self._preparar_cambio():
+            return
+
+        eliminados = {id(obs) for obs in obstaculos}
+        self.obstaculos = deque(obs for obs in self.obstaculos if id(obs) not in eliminados)
+
+        self._terminar_cambio()
+
+    def _preparar_cambio(self):
+        """
+        Indica si el cambio recién hecho en el árbol puede aplicarse de forma incremental:
+        la ventana debe estar sincronizada con la versión inmediatamente anterior.
+        """
+        if self._version == self.arbol.version:
+            return False  # El árbol no cambió (por ejemplo, inserción repetida)
+        if self._version is None or self._version + 1 != self.arbol.version:
+            self._version = None  # Cambios desconocidos: reconstruir en el próximo frame
+            return False
+        return True
+
+    def _terminar_cambio(self):
+        """Reubica el cursor del borde derecho tras un cambio en el árbol"""
+        # Las rotaciones invalidan la pila del iterador: volver a buscar en O(log n)
+        self._cursor = self.arbol.iter_inorden_desde(self.x_max, estricto=True)
+        self._siguiente = next(self._cursor, None)
+        self._avanzar_borde_derecho()
+        self._version = self.arbol.version
+
+    def _reconstruir(self, x_min, x_max):
+        """Reconstruye la ventana completa con una búsqueda desde la raíz"""
+        self.obstaculos.clear()
+        self.x_min = x_min
+        self.x_max = x_max
+        self._cursor = self.arbol.iter_inorden_desde(x_min)
+        self._siguiente = next(self._cursor, None)
+        self._avanzar_borde_derecho()
+        self._version = self.arbol.version
+
+    def _avanzar_borde_derecho(self):
+        """Agrega los obstáculos que quedaron dentro del borde derecho"""
+        while self._siguiente is not None and self._siguiente.x <= self.x_max:
+            self.obstaculos.append(self._siguiente)
+            self._siguiente = next(self._cursor, None)
@@ -5,6 +5,22 @@ Muestra el árbol directamente en la ventana del juego
 
 import pygame
 import math
+from itertools import islice
+from cache_texto import renderizar_texto
+
+# Diseño del árbol: cada nivel baja DISTANCIA_NIVEL y reduce la separación horizontal
+RADIO_NODO = 25
+DISTANCIA_NIVEL = 60
+FACTOR_SEPARACION = 0.7
+MARGEN_ETIQUETA = 45  # El tipo se escribe debajo del círculo
+
+# Vista del overlay del árbol (pan/zoom)
+ZOOM_MINIMO = 0.25
+ZOOM_MAXIMO = 256
+FACTOR_ZOOM = 1.5
+
+# Overlay de recorridos: elementos mostrados por página
+ELEMENTOS_POR_PAGINA = 12
 
 class VisualizadorAVLPygame:
     def __init__(self, pantalla, ancho, alto):
@@ -18,6 +34,7 @@ class VisualizadorAVLPygame:
         self.COLOR_LINEA = (80, 80, 80)
         self.COLOR_FONDO = (30, 30, 30)
         self.COLOR_ALTURA = (255, 200, 100)
+        self.COLOR_RESUMEN = (120, 90, 200)
         
         # Fuentes
         try:
@@ -33,6 +50,75 @@ class VisualizadorAVLPygame:
         self.mostrar_estadisticas = False
         self.mostrar_recorridos = False
         self.tipo_recorrido_actual = "inorden"  # inorden, preorden, postorden
+        self.pagina_recorrido = 0
+        
+        # Overlay del árbol ya renderizado; se reconstruye solo si el árbol cambia de versión
+        self._overlay_arbol = None
+        self._clave_overlay_arbol = None
+        
+        # Vista del árbol: punto del diseño que queda en el centro de la pantalla y zoom
+        self.reiniciar_vista()
+        self.nodos_dibujados = 0
+        self.resumenes_dibujados = 0
+    
+    def reiniciar_vista(self):
+        """Vuelve a la vista inicial del árbol (raíz arriba al centro, sin zoom)"""
+        self.centro_vista = (self.ancho / 2, self.alto / 2)
+        self.zoom = 1.0
+    
+    def manejar_tecla(self, event):
+        """
+        Pan/zoom del overlay del árbol: +/- zoom, W/A/S/D mover, 0 centrar.
+        Páginas del overlay de recorridos: RePág/AvPág, Inicio/Fin.
+        Devuelve True si la tecla fue consumida por el visualizador.
+        """
+        if self.mostrar_recorridos and self._manejar_tecla_recorridos(event):
+            return True
+        if not self.mostrar_arbol:
+            return False
+        
+        # Cada paso mueve un cuarto de pantalla, sin importar el zoom
+        paso_x = self.ancho / 4 / self.zoom
+        paso_y = self.alto / 4 / self.zoom
+        centro_x, centro_y = self.centro_vista
+        
+        if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.zoom = min(ZOOM_MAXIMO, self.zoom * FACTOR_ZOOM)
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.zoom = max(ZOOM_MINIMO, self.zoom / FACTOR_ZOOM)
+        elif event.key == pygame.K_a:
+            self.centro_vista = (centro_x - paso_x, centro_y)
+        elif event.key == pygame.K_d:
+            self.centro_vista = (centro_x + paso_x, centro_y)
+        elif event.key == pygame.K_w:
+            self.centro_vista = (centro_x, centro_y - paso_y)
+        elif event.key == pygame.K_s:
+            self.centro_vista = (centro_x, centro_y + paso_y)
+        elif event.key in (pygame.K_0, pygame.K_KP0):
+            self.reiniciar_vista()
+        else:
+            return False
+        return True
+    
+    def _manejar_tecla_recorridos(self, event):
+        """Cambia de página en el overlay de recorridos (la página se ajusta al dibujar)"""
+        if event.key == pygame.K_PAGEDOWN:
+            self.pagina_recorrido += 1
+        elif event.key == pygame.K_PAGEUP:
+            self.pagina_recorrido = max(0, self.pagina_recorrido - 1)
+        elif event.key == pygame.K_HOME:
+            self.pagina_recorrido = 0
+        elif event.key == pygame.K_END:
+            self.pagina_recorrido = math.inf  # La última página, sea cual sea el tamaño del árbol
+        else:
+            return False
+        return True
+    
+    def _pagina_actual(self, arbol_avl):
+        """Página de recorridos que se muestra, limitada a las páginas que tiene el árbol"""
+        total_paginas = max(1, math.ceil(arbol_avl.contar_nodos() / ELEMENTOS_POR_PAGINA))
+        self.pagina_recorrido = min(self.pagina_recorrido, total_paginas - 1)
+        return self.pagina_recorrido, total_paginas
     
     def toggle_arbol(self):
         """Alterna la visualización del árbol"""
@@ -46,6 +132,7 @@ class VisualizadorAVLPygame:
     
     def toggle_recorridos(self):
         """Alterna la visualización de recorridos y cambia el tipo"""
+        self.pagina_recorrido = 0
         if not self.mostrar_recorridos:
             self.mostrar_recorridos = True
             self.tipo_recorrido_actual = "inorden"
@@ -62,31 +149,47 @@ class VisualizadorAVLPygame:
         
         return self.mostrar_recorridos, self.tipo_recorrido_actual
     
+    def firma_estado(self, arbol_avl):
+        """Resume todo lo que determina cómo se ven los overlays (para el renderizado por regiones)"""
+        if not (self.mostrar_arbol or self.mostrar_estadisticas or self.mostrar_recorridos):
+            return None
+        pagina = self._pagina_actual(arbol_avl)[0] if self.mostrar_recorridos else 0
+        return (self.mostrar_arbol, self.mostrar_estadisticas, self.mostrar_recorridos,
+                self.tipo_recorrido_actual, pagina, arbol_avl, arbol_avl.version,
+                self.centro_vista, self.zoom)
+    
     def dibujar_overlay_arbol(self, arbol_avl):
         """Dibuja el árbol como overlay sobre el juego"""
         if not self.mostrar_arbol or not arbol_avl.raiz:
             return
         
+        # El árbol solo cambia al insertar o eliminar: reutilizar el overlay mientras
+        # no cambie ni el árbol ni la vista
+        clave = (arbol_avl, arbol_avl.version, self.centro_vista, self.zoom)
+        if clave != self._clave_overlay_arbol:
+            self._overlay_arbol = self._renderizar_overlay_arbol(arbol_avl)
+            self._clave_overlay_arbol = clave
+        
+        self.pantalla.blit(self._overlay_arbol, (0, 0))
+    
+    def _renderizar_overlay_arbol(self, arbol_avl):
+        """Renderiza el overlay completo del árbol en una superficie nueva"""
         # Crear superficie semi-transparente
         overlay = pygame.Surface((self.ancho, self.alto))
         overlay.set_alpha(220)
         overlay.fill(self.COLOR_FONDO)
         
         # Título
-        titulo = self.font_titulo.render("🌳 Árbol AVL - Obstáculos", True, (255, 255, 255))
+        titulo = renderizar_texto(self.font_titulo, "🌳 Árbol AVL - Obstáculos", True, (255, 255, 255))
         titulo_rect = titulo.get_rect(center=(self.ancho//2, 30))
         overlay.blit(titulo, titulo_rect)
         
-        # Calcular posiciones de nodos
-        posiciones = {}
-        self._calcular_posiciones(arbol_avl.raiz, self.ancho//2, 80, 
-                                 self.ancho//4, posiciones)
-        
-        # Dibujar líneas (conexiones)
-        self._dibujar_conexiones(overlay, arbol_avl.raiz, posiciones)
-        
-        # Dibujar nodos
-        self._dibujar_nodos(overlay, arbol_avl.raiz, posiciones)
+        # Dibujar solo los subárboles visibles con la vista actual
+        self.nodos_dibujados = 0
+        self.resumenes_dibujados = 0
+        radio = max(4, int(RADIO_NODO * min(1.0, self.zoom)))
+        self._dibujar_subarbol(overlay, arbol_avl.raiz, self.ancho//2, 80,
+                               self.ancho//4, radio)
         
         # Información adicional
         self._dibujar_info_arbol(overlay, arbol_avl)
@@ -95,14 +198,20 @@ class VisualizadorAVLPygame:
         instrucciones = [
             "V: Ocultar árbol",
             "E: Ver estadísticas", 
+            "+/-: Zoom | WASD: Mover | 0: Centrar",
             "Auto-eliminación: ON ♻️"
         ]
         
         for i, instruccion in enumerate(instrucciones):
-            texto = self.font_info.render(instruccion, True, (200, 200, 200))
-            overlay.blit(texto, (10, self.alto - 80 + i * 25))
+            texto = renderizar_texto(self.font_info, instruccion, True, (200, 200, 200))
+            overlay.blit(texto, (10, self.alto - 105 + i * 25))
+        
+        vista_texto = (f"Zoom x{self.zoom:.2f} | Nodos dibujados: {self.nodos_dibujados}"
+                       f" | Subárboles resumidos: {self.resumenes_dibujados}")
+        vista_surface = renderizar_texto(self.font_info, vista_texto, True, (200, 200, 200))
+        overlay.blit(vista_surface, vista_surface.get_rect(topright=(self.ancho - 10, 55)))
         
-        self.pantalla.blit(overlay, (0, 0))
+        return overlay
     
     def dibujar_overlay_estadisticas(self, arbol_avl):
         """Dibuja estadísticas como overlay"""
@@ -110,7 +219,7 @@ class VisualizadorAVLPygame:
             return
         
         # Crear superficie semi-transparente
-        overlay = pygame.Surface((400, 300))
+        overlay = pygame.Surface((400, 390))
         overlay.set_alpha(230)
         overlay.fill((40, 40, 60))
         
@@ -118,33 +227,38 @@ class VisualizadorAVLPygame:
         pygame.draw.rect(overlay, (100, 100, 150), overlay.get_rect(), 3)
         
         # Título
-        titulo = self.font_titulo.render("📊 Estadísticas AVL", True, (255, 255, 255))
+        titulo = renderizar_texto(self.font_titulo, "📊 Estadísticas AVL", True, (255, 255, 255))
         overlay.blit(titulo, (20, 20))
         
-        # Obtener estadísticas
-        altura = arbol_avl.obtener_altura()
-        total_nodos = arbol_avl.contar_nodos()
-        altura_ideal = max(1, total_nodos.bit_length() - 1) if total_nodos > 0 else 1
-        eficiencia = (altura_ideal / altura * 100) if altura > 0 else 100
+        # Obtener estadísticas (mantenidas por el árbol, sin recorrerlo)
+        estadisticas = arbol_avl.obtener_estadisticas()
+        altura = estadisticas['altura']
+        altura_ideal = estadisticas['altura_ideal']
+        eficiencia = estadisticas['eficiencia']
+        rotaciones = estadisticas['rotaciones']
+        por_tipo = " ".join(f"{tipo[:3]}:{cantidad}" for tipo, cantidad in sorted(estadisticas['por_tipo'].items()))
         
         # Mostrar estadísticas
         stats = [
             f"Altura actual: {altura}",
-            f"Total nodos: {total_nodos}",
+            f"Total nodos: {estadisticas['nodos']}",
             f"Altura ideal: {altura_ideal}",
             f"Eficiencia: {eficiencia:.1f}%",
-            f"Estado: {'✅ Balanceado' if eficiencia > 70 else '⚠️ Puede mejorar'}"
+            f"Estado: {'✅ Balanceado' if eficiencia > 70 else '⚠️ Puede mejorar'}",
+            f"Rotaciones: {rotaciones['izquierda']} izq / {rotaciones['derecha']} der",
+            f"Inserciones: {estadisticas['inserciones']} | Eliminaciones: {estadisticas['eliminaciones']}",
+            f"Por tipo: {por_tipo or '-'}"
         ]
         
         y_pos = 60
         for stat in stats:
             color = (150, 255, 150) if "✅" in stat else (255, 255, 150) if "⚠️" in stat else (255, 255, 255)
-            texto = self.font_info.render(stat, True, color)
+            texto = renderizar_texto(self.font_info, stat, True, color)
             overlay.blit(texto, (20, y_pos))
             y_pos += 30
         
         # Gráfico de barras simple
-        bar_y = 200
+        bar_y = 300
         bar_height = 20
         max_width = 300
         
@@ -159,8 +273,8 @@ class VisualizadorAVLPygame:
                         (20, bar_y + 30, ideal_width, bar_height))
         
         # Etiquetas
-        label1 = self.font_info.render("Altura actual", True, (255, 255, 255))
-        label2 = self.font_info.render("Altura ideal", True, (255, 255, 255))
+        label1 = renderizar_texto(self.font_info, "Altura actual", True, (255, 255, 255))
+        label2 = renderizar_texto(self.font_info, "Altura ideal", True, (255, 255, 255))
         overlay.blit(label1, (330, bar_y))
         overlay.blit(label2, (330, bar_y + 30))
         
@@ -190,25 +304,25 @@ class VisualizadorAVLPygame:
             "postorden": "📋 Recorrido POSTORDEN (Izq → Der → Raíz)"
         }
         
-        titulo = self.font_titulo.render(titulos[self.tipo_recorrido_actual], True, (255, 255, 255))
+        titulo = renderizar_texto(self.font_titulo, titulos[self.tipo_recorrido_actual], True, (255, 255, 255))
         overlay.blit(titulo, (20, 20))
         
-        # Obtener el recorrido según el tipo
+        # Recorrer solo la página actual: el generador salta directo a su primera
+        # posición y se detiene al completar la página
+        pagina, total_paginas = self._pagina_actual(arbol_avl)
+        inicio = pagina * ELEMENTOS_POR_PAGINA
         if self.tipo_recorrido_actual == "inorden":
-            recorrido = arbol_avl.recorrido_inorden()
+            recorrido = arbol_avl.iter_inorden(inicio)
         elif self.tipo_recorrido_actual == "preorden":
-            recorrido = arbol_avl.recorrido_preorden()
+            recorrido = arbol_avl.iter_preorden(inicio)
         else:  # postorden
-            recorrido = arbol_avl.recorrido_postorden()
+            recorrido = arbol_avl.iter_postorden(inicio)
         
         # Mostrar elementos del recorrido
         y_pos = 70
         elementos_por_fila = 2
-        for i, obs in enumerate(recorrido):
-            if i >= 12:  # Limitar a 12 elementos para que quepan
-                texto_mas = self.font_info.render(f"... y {len(recorrido) - i} más", True, (200, 200, 200))
-                overlay.blit(texto_mas, (20, y_pos))
-                break
+        for j, obs in enumerate(islice(recorrido, ELEMENTOS_POR_PAGINA)):
+            i = inicio + j
             
             # Color según el tipo de obstáculo
             colores_tipo = {
@@ -217,28 +331,36 @@ class VisualizadorAVLPygame:
                 'hueco': (150, 100, 255),
                 'aceite': (100, 200, 100)
             }
-            color = colores_tipo.get(obs['tipo'], (255, 255, 255))
+            color = colores_tipo.get(obs.tipo, (255, 255, 255))
             
             # Texto del elemento
-            texto = f"{i+1}. ({obs['x']},{obs['y']}) {obs['tipo'].upper()}"
-            texto_surface = self.font_info.render(texto, True, color)
+            texto = f"{i+1}. ({obs.x},{obs.y}) {obs.tipo.upper()}"
+            texto_surface = renderizar_texto(self.font_info, texto, True, color)
             
             # Posición en columnas
-            x_pos = 20 + (i % elementos_por_fila) * 280
-            if i % elementos_por_fila == 0 and i > 0:
+            x_pos = 20 + (j % elementos_por_fila) * 280
+            if j % elementos_por_fila == 0 and j > 0:
                 y_pos += 30
             
             overlay.blit(texto_surface, (x_pos, y_pos))
         
+        # Página actual
+        total = arbol_avl.contar_nodos()
+        fin = min(inicio + ELEMENTOS_POR_PAGINA, total)
+        texto_pagina = f"Página {pagina + 1}/{total_paginas} ({inicio + 1}-{fin} de {total})"
+        pagina_surface = renderizar_texto(self.font_info, texto_pagina, True, (200, 200, 200))
+        overlay.blit(pagina_surface, (20, 265))
+        
         # Instrucciones
         instrucciones = [
             "T: Cambiar tipo de recorrido",
-            "Inorden → Preorden → Postorden → Cerrar"
+            "Inorden → Preorden → Postorden → Cerrar",
+            "RePág/AvPág: Página | Inicio/Fin"
         ]
         
         for i, instruccion in enumerate(instrucciones):
-            texto = self.font_info.render(instruccion, True, (200, 200, 200))
-            overlay.blit(texto, (20, 320 + i * 25))
+            texto = renderizar_texto(self.font_info, instruccion, True, (200, 200, 200))
+            overlay.blit(texto, (20, 300 + i * 25))
         
         # Posicionar en el centro-derecha
         pos_x = self.ancho - 620
@@ -246,97 +368,114 @@ class VisualizadorAVLPygame:
         
         self.pantalla.blit(overlay, (pos_x, pos_y))
     
-    def _calcular_posiciones(self, nodo, x, y, separacion, posiciones):
-        """Calcula las posiciones de todos los nodos recursivamente"""
-        if not nodo:
+    def _a_pantalla(self, x, y):
+        """Convierte coordenadas del diseño del árbol a coordenadas de pantalla según la vista"""
+        return (self.ancho / 2 + (x - self.centro_vista[0]) * self.zoom,
+                self.alto / 2 + (y - self.centro_vista[1]) * self.zoom)
+    
+    def _dibujar_subarbol(self, superficie, nodo, x, y, separacion, radio):
+        """
+        Dibuja un subárbol visitando solo lo que cae dentro de la pantalla.
+        (x, y) es la posición del nodo en el diseño y separacion la distancia a sus hijos,
+        que se reduce a 0.7 por nivel: el subárbol entero cabe en
+        ±separacion * (1 - 0.7^(h-1)) / 0.3 horizontalmente y 60 * (h-1) hacia abajo.
+        """
+        sx, sy = self._a_pantalla(x, y)
+        
+        # Descartar el subárbol completo si su caja no toca la pantalla
+        extension = separacion * (1 - FACTOR_SEPARACION ** (nodo.altura - 1)) / (1 - FACTOR_SEPARACION)
+        medio_ancho = extension * self.zoom + radio
+        alto_caja = DISTANCIA_NIVEL * (nodo.altura - 1) * self.zoom + radio + MARGEN_ETIQUETA
+        if (sx + medio_ancho < 0 or sx - medio_ancho > self.ancho or
+                sy + alto_caja < 0 or sy - radio > self.alto):
             return
         
-        posiciones[id(nodo)] = (x, y)
-        
-        # Calcular posiciones de hijos
-        if nodo.izquierdo:
-            self._calcular_posiciones(nodo.izquierdo, x - separacion, y + 60,
-                                    separacion * 0.7, posiciones)
-        
-        if nodo.derecho:
-            self._calcular_posiciones(nodo.derecho, x + separacion, y + 60,
-                                    separacion * 0.7, posiciones)
-    
-    def _dibujar_conexiones(self, superficie, nodo, posiciones):
-        """Dibuja las líneas que conectan los nodos"""
-        if not nodo:
+        # Nivel de detalle: si los hijos quedarían casi encima del padre, resumir el subárbol
+        if nodo.altura > 1 and separacion * self.zoom < radio:
+            self._dibujar_resumen(superficie, nodo, sx, sy, radio)
             return
         
-        x, y = posiciones[id(nodo)]
+        # Conexiones a los hijos (debajo de los nodos)
+        y_hijos = y + DISTANCIA_NIVEL
+        for hijo, x_hijo in ((nodo.izquierdo, x - separacion), (nodo.derecho, x + separacion)):
+            if hijo:
+                sx_hijo, sy_hijo = self._a_pantalla(x_hijo, y_hijos)
+                pygame.draw.line(superficie, self.COLOR_LINEA, (int(sx), int(sy)),
+                                 (int(sx_hijo), int(sy_hijo)), 2)
         
-        # Conexión al hijo izquierdo
         if nodo.izquierdo:
-            x_hijo, y_hijo = posiciones[id(nodo.izquierdo)]
-            pygame.draw.line(superficie, self.COLOR_LINEA, (x, y), (x_hijo, y_hijo), 2)
-            self._dibujar_conexiones(superficie, nodo.izquierdo, posiciones)
-        
-        # Conexión al hijo derecho
+            self._dibujar_subarbol(superficie, nodo.izquierdo, x - separacion, y_hijos,
+                                   separacion * FACTOR_SEPARACION, radio)
         if nodo.derecho:
-            x_hijo, y_hijo = posiciones[id(nodo.derecho)]
-            pygame.draw.line(superficie, self.COLOR_LINEA, (x, y), (x_hijo, y_hijo), 2)
-            self._dibujar_conexiones(superficie, nodo.derecho, posiciones)
-    
-    def _dibujar_nodos(self, superficie, nodo, posiciones):
-        """Dibuja todos los nodos del árbol"""
-        if not nodo:
-            return
+            self._dibujar_subarbol(superficie, nodo.derecho, x + separacion, y_hijos,
+                                   separacion * FACTOR_SEPARACION, radio)
         
-        x, y = posiciones[id(nodo)]
+        self._dibujar_nodo(superficie, nodo, sx, sy, radio)
+    
+    def _dibujar_nodo(self, superficie, nodo, x, y, radio):
+        """Dibuja un nodo con sus coordenadas, altura y tipo"""
+        self.nodos_dibujados += 1
         
         # Dibujar círculo del nodo
-        radio = 25
         pygame.draw.circle(superficie, self.COLOR_NODO, (int(x), int(y)), radio)
         pygame.draw.circle(superficie, (255, 255, 255), (int(x), int(y)), radio, 2)
         
+        if radio < RADIO_NODO:
+            return  # Con zoom alejado el texto no cabe
+        
         # Texto del nodo (coordenadas x,y del obstáculo)
         obs = nodo.obstaculo
-        texto_principal = f"({obs['x']},{obs['y']})"
-        texto_surface = self.font_nodo.render(texto_principal, True, self.COLOR_TEXTO)
+        texto_principal = f"({obs.x},{obs.y})"
+        texto_surface = renderizar_texto(self.font_nodo, texto_principal, True, self.COLOR_TEXTO)
         texto_rect = texto_surface.get_rect(center=(x, y - 5))
         superficie.blit(texto_surface, texto_rect)
         
         # Altura del nodo
         altura_texto = f"h={nodo.altura}"
-        altura_surface = self.font_nodo.render(altura_texto, True, self.COLOR_ALTURA)
+        altura_surface = renderizar_texto(self.font_nodo, altura_texto, True, self.COLOR_ALTURA)
         altura_rect = altura_surface.get_rect(center=(x, y + 8))
         superficie.blit(altura_surface, altura_rect)
         
         # Tipo de obstáculo (abreviado)
-        tipo_abrev = obs['tipo'][:3].upper()
-        tipo_surface = self.font_nodo.render(tipo_abrev, True, (200, 200, 255))
+        tipo_abrev = obs.tipo[:3].upper()
+        tipo_surface = renderizar_texto(self.font_nodo, tipo_abrev, True, (200, 200, 255))
         tipo_rect = tipo_surface.get_rect(center=(x, y + 35))
         superficie.blit(tipo_surface, tipo_rect)
-        
-        # Dibujar hijos recursivamente
-        if nodo.izquierdo:
-            self._dibujar_nodos(superficie, nodo.izquierdo, posiciones)
-        
-        if nodo.derecho:
-            self._dibujar_nodos(superficie, nodo.derecho, posiciones)
+    
+    def _dibujar_resumen(self, superficie, nodo, x, y, radio):
+        """Dibuja un subárbol colapsado: un triángulo con su cantidad de nodos y su altura"""
+        self.resumenes_dibujados += 1
+        
+        ancho = max(2 * radio, 56)
+        alto = max(2 * radio, 44)
+        puntos = [(int(x), int(y - radio)),
+                  (int(x - ancho // 2), int(y - radio + alto)),
+                  (int(x + ancho // 2), int(y - radio + alto))]
+        pygame.draw.polygon(superficie, self.COLOR_RESUMEN, puntos)
+        pygame.draw.polygon(superficie, (255, 255, 255), puntos, 1)
+        
+        cantidad_surface = renderizar_texto(self.font_nodo, f"n={nodo.tamano}", True, self.COLOR_TEXTO)
+        superficie.blit(cantidad_surface, cantidad_surface.get_rect(center=(x, y - radio + alto - 22)))
+        altura_surface = renderizar_texto(self.font_nodo, f"h={nodo.altura}", True, self.COLOR_ALTURA)
+        superficie.blit(altura_surface, altura_surface.get_rect(center=(x, y - radio + alto - 8)))
     
     def _dibujar_info_arbol(self, superficie, arbol_avl):
         """Dibuja información adicional del árbol"""
         # Información en la parte inferior
-        altura = arbol_avl.obtener_altura()
-        total_nodos = arbol_avl.contar_nodos()
+        estadisticas = arbol_avl.obtener_estadisticas()
+        altura = estadisticas['altura']
         
-        info_texto = f"Altura: {altura} | Nodos: {total_nodos} | Auto-limpieza activa ♻️"
-        info_surface = self.font_info.render(info_texto, True, (255, 255, 255))
+        info_texto = f"Altura: {altura} | Nodos: {estadisticas['nodos']} | Auto-limpieza activa ♻️"
+        info_surface = renderizar_texto(self.font_info, info_texto, True, (255, 255, 255))
         info_rect = info_surface.get_rect(center=(self.ancho//2, self.alto - 120))
         superficie.blit(info_surface, info_rect)
         
         # Estado del balance
-        altura_ideal = max(1, total_nodos.bit_length() - 1) if total_nodos > 0 else 1
-        balance_ok = altura <= 2 * altura_ideal
+        balance_ok = altura <= 2 * estadisticas['altura_ideal']
         estado_texto = "✅ Árbol bien balanceado" if balance_ok else "⚠️ Árbol puede optimizarse"
         color_estado = (150, 255, 150) if balance_ok else (255, 255, 150)
         
-        estado_surface = self.font_info.render(estado_texto, True, color_estado)
+        estado_surface = renderizar_texto(self.font_info, estado_texto, True, color_estado)
         estado_rect = estado_surface.get_rect(center=(self.ancho//2, self.alto - 95))
         superficie.blit(estado_surface, estado_rect)
     